@@ -0,0 +1,121 @@
+"""Offline benchmark of the Electrolux Status hot paths.
+
+Replays the fixtures through ``FakeSession`` and reports, for fleets of 1 to 100 appliances,
+the ``Appliance.setup`` time, the first and steady-state refresh latency of the coordinator,
+the memory allocated by a refresh and the number of entities.
+
+Run from the repository root (requires Home Assistant to be installed)::
+
+    python -m benchmarks.bench_coordinator [--latency 0.05] [--rounds 5] [--fleets 1,10,50,100]
+"""
+import argparse
+import asyncio
+import statistics
+import tempfile
+import time
+import tracemalloc
+from datetime import timedelta
+
+from homeassistant.core import HomeAssistant
+
+from custom_components.electrolux_status import ElectroluxStatusDataUpdateCoordinator
+from custom_components.electrolux_status.api import Appliance, ElectroluxLibraryEntity
+from custom_components.electrolux_status.profile_cache import ProfileCache
+
+from .fake_cloud import FakeSession
+
+
+def make_hass(config_dir) -> HomeAssistant:
+    try:
+        return HomeAssistant(config_dir)
+    except TypeError:
+        # Home Assistant before 2023.x takes no arguments
+        hass = HomeAssistant()
+        hass.config.config_dir = config_dir
+        return hass
+
+
+def bench_setup(size, rounds):
+    """Return the best time to set up every appliance of the fleet from already fetched payloads."""
+    session = FakeSession(size)
+    payloads = [
+        (pnc_id, info, session.getApplianceConnectionState(pnc_id), session.getApplianceState(pnc_id),
+         session.getApplianceProfile(pnc_id))
+        for pnc_id, info in session.getAppliances().items()
+    ]
+
+    def run():
+        for pnc_id, info, connection_state, state, profile in payloads:
+            data = ElectroluxLibraryEntity(info["alias"], connection_state, state, profile)
+            Appliance(info["alias"], pnc_id, info["brand"], info["model"]).setup(data)
+
+    timings = []
+    for _ in range(rounds):
+        start = time.perf_counter()
+        run()
+        timings.append(time.perf_counter() - start)
+    return min(timings)
+
+
+async def bench_refresh(hass, size, latency, rounds):
+    """Time the first discovery and then polls of every appliance coordinator against the fake cloud."""
+    session = FakeSession(size, latency)
+    coordinator = ElectroluxStatusDataUpdateCoordinator(
+        hass, client=session, update_interval=timedelta(seconds=30), profile_cache=ProfileCache(hass),
+    )
+
+    async def discover():
+        start = time.perf_counter()
+        coordinator.data = await coordinator._async_update_data()
+        return time.perf_counter() - start
+
+    async def refresh():
+        # Poll every appliance now, the adaptive schedule would otherwise skip idle ones
+        start = time.perf_counter()
+        await coordinator.async_refresh_appliances()
+        return time.perf_counter() - start
+
+    first = await discover()
+    steady = [await refresh() for _ in range(rounds)]
+
+    tracemalloc.start()
+    await refresh()
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+
+    appliances = coordinator.data["appliances"].found_appliances.values()
+    return {
+        "first": first,
+        "steady": statistics.median(steady),
+        "steady_max": max(steady),
+        "peak_kib": peak / 1024,
+        "entities": sum(len(appliance.entities) for appliance in appliances),
+        "calls": sum(session.calls.values()),
+    }
+
+
+async def async_main(args):
+    fleets = [int(size) for size in args.fleets.split(",")]
+    with tempfile.TemporaryDirectory() as config_dir:
+        hass = make_hass(config_dir)
+        print(f"cloud latency {args.latency * 1000:.0f} ms, {args.rounds} rounds")
+        print(f"{'fleet':>6} {'entities':>9} {'setup ms':>9} {'first ms':>9} {'refresh ms':>11} "
+              f"{'max ms':>8} {'alloc KiB':>10} {'calls':>6}")
+        for size in fleets:
+            setup = bench_setup(size, args.rounds)
+            result = await bench_refresh(hass, size, args.latency, args.rounds)
+            print(f"{size:>6} {result['entities']:>9} {setup * 1000:>9.2f} {result['first'] * 1000:>9.2f} "
+                  f"{result['steady'] * 1000:>11.2f} {result['steady_max'] * 1000:>8.2f} "
+                  f"{result['peak_kib']:>10.1f} {result['calls']:>6}")
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--latency", type=float, default=0.0, help="simulated cloud round-trip in seconds")
+    parser.add_argument("--rounds", type=int, default=5)
+    parser.add_argument("--fleets", default="1,10,50,100", help="comma separated fleet sizes")
+    asyncio.run(async_main(parser.parse_args()))
+
+
+if __name__ == "__main__":
+    main()
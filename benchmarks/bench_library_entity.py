@@ -0,0 +1,122 @@
+"""Micro-benchmark of ElectroluxLibraryEntity lookups.
+
+Compares ``Appliance.setup`` on the indexed ``ElectroluxLibraryEntity`` with the
+previous linear-scan lookups, on a large generated appliance state dump.
+
+Run from the repository root (requires Home Assistant to be installed)::
+
+    python -m benchmarks.bench_library_entity [states] [rounds]
+"""
+import sys
+import timeit
+
+from custom_components.electrolux_status.api import Appliance, ElectroluxLibraryEntity
+from custom_components.electrolux_status.const import sensors, sensors_binary
+
+SOURCES = ["WD1", "WD2", "NIU", "APL"]
+
+
+def make_state_dump(size):
+    """Return (status, states, profile) with roughly ``size`` state entries."""
+    names = [name for table in (sensors, sensors_binary) for group in table.values() for name in group]
+    container_names = {name for group in sensors.values() for name, params in group.items() if params[0] == "container"}
+    states = {}
+    profile = {}
+    for i in range(size):
+        source = SOURCES[i % len(SOURCES)]
+        name = names[i % len(names)] if i < len(names) * 2 else f"Unknown{i}"
+        state = {"name": name, "source": source, "numberValue": i, "nameTransl": f"{name} :"}
+        if name in container_names or i % 10 == 0:
+            state["container"] = {
+                "1": {"name": "Coefficient", "numberValue": 21},
+                "3": {"name": "Exponent", "numberValue": 0},
+                "4": {"name": f"Container{i}", "numberValue": i},
+            }
+        states[f"0x{i:04X}-{source}"] = state
+        profile[f"0x{i:04X}-{source}"] = {"name": name, "source": source}
+    profile["0x0403-WD1"] = {
+        "name": "ExecuteCommand", "source": "WD1", "steps": {"2": {"transl": "Start"}, "4": {"transl": "Pause"}},
+    }
+    return {"status": "Connected"}, states, profile
+
+
+class LinearLibraryEntity(ElectroluxLibraryEntity):
+    """The linear-scan lookups ElectroluxLibraryEntity used before it was indexed."""
+
+    def get_value(self, attr_name, field=None, source=None):
+        if attr_name in ['StartTime', 'TimeToEnd', 'RunningTime', 'DryingTime', 'ApplianceTotalWorkingTime', "FCTotalWashingTime"]:
+            return self.time_to_end_in_minutes(attr_name, field, source)
+        if attr_name in self.status:
+            return self.status.get(attr_name)
+        if attr_name in [self.states[k].get("name") for k in self.states]:
+            val = self.get_from_states(attr_name, field, source)
+            if field == "container":
+                if val["1"]["name"] == "Coefficient" and val["3"]["name"] == "Exponent":
+                    return val["1"]["numberValue"] * (10 ** val["3"]["numberValue"])
+            else:
+                return val
+        if attr_name in [self.states[st]["container"][cr].get("name") for st in self.states for cr in self.states[st].get("container", [])]:
+            return self.get_from_states(attr_name, field, source)
+        return None
+
+    def get_from_states(self, attr_name, field, source):
+        for k in self.states:
+            if attr_name == self.states[k].get("name") and source == self.states[k].get("source"):
+                return self._get_states(self.states[k], field) if field else self._get_states(self.states[k])
+            for c in self.states[k].get("container", []):
+                if attr_name == self.states[k]["container"][c].get("name"):
+                    return self._get_states(self.states[k]["container"][c], field) if field else self._get_states(self.states[k]["container"][c])
+        return None
+
+    def get_sensor_name(self, attr_name, source):
+        for k in self.states:
+            if attr_name == self.states[k].get("name") and source == self.states[k].get("source"):
+                if "nameTransl" in self.states[k].keys():
+                    return self.states[k].get("nameTransl").strip(" :.")
+                return self.states[k].get("name").strip(" :.")
+            for c in self.states[k].get("container", []):
+                if attr_name == self.states[k]["container"][c].get("name"):
+                    if "nameTransl" in self.states[k]["container"][c].keys():
+                        return self.states[k]["container"][c].get("nameTransl").strip(" :.")
+                    return self.states[k]["container"][c].get("name").strip(" :.")
+        return None
+
+    def value_exists(self, attr_name, source):
+        _container_attr = []
+        for k in self.states:
+            for c in self.states[k].get("container", []):
+                _container_attr.append(self.states[k]["container"][c].get("name"))
+        return (attr_name in self.status) or \
+            (attr_name in [self.states[k].get("name") for k in self.states if self.states[k].get("source") == source]) or \
+            (attr_name in [self.profile[k].get("name") for k in self.profile if self.profile[k].get("source") == source]) or \
+            (attr_name in _container_attr)
+
+    def get_suffix(self, attr_name, source):
+        res = list({self.states[k].get("source") for k in self.states if self.states[k].get("name") == attr_name})
+        if len(res) == 1:
+            return ""
+        if source in res:
+            return f" ({source})"
+        return ""
+
+
+def bench(entity_class, dump, rounds):
+    def run():
+        Appliance("Washer", "914000000", "Electrolux", "EW9F149SP").setup(entity_class("Washer", *dump))
+    return min(timeit.repeat(run, number=1, repeat=rounds))
+
+
+def main():
+    size = int(sys.argv[1]) if len(sys.argv) > 1 else 2000
+    rounds = int(sys.argv[2]) if len(sys.argv) > 2 else 5
+    dump = make_state_dump(size)
+    linear = bench(LinearLibraryEntity, dump, rounds)
+    indexed = bench(ElectroluxLibraryEntity, dump, rounds)
+    print(f"Appliance.setup on {size} states (best of {rounds})")
+    print(f"  linear : {linear * 1000:9.2f} ms")
+    print(f"  indexed: {indexed * 1000:9.2f} ms")
+    print(f"  speedup: {linear / indexed:9.1f}x")
+
+
+if __name__ == "__main__":
+    main()
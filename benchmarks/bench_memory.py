@@ -0,0 +1,108 @@
+"""Memory benchmark of the Electrolux Status entity model.
+
+Builds the entities of a fleet of appliances from the fixtures, once with dict-backed copies of
+the previous entity classes and once with the slotted descriptor based ones, and reports the
+memory held per entity and per ``ElectroluxLibraryEntity`` instance.
+
+Run from the repository root (requires Home Assistant to be installed)::
+
+    python -m benchmarks.bench_memory [appliances]
+"""
+import sys
+import tracemalloc
+
+from custom_components.electrolux_status.api import Appliance, ElectroluxLibraryEntity
+from custom_components.electrolux_status.const import BINARY_SENSOR, BUTTON, SENSOR
+
+from .fake_cloud import FakeSession
+
+
+class LegacyEntity:
+    """The entity classes before they were slotted, attributes copied into every instance."""
+
+    def __init__(self, entity_type, name, attr, device_class, entity_category, field, source, val_to_send=None,
+                 icon=None, unit=None, invert=False) -> None:
+        self.entity_type = entity_type
+        self.attr = attr
+        self.name = name
+        self.device_class = device_class
+        self.entity_category = entity_category
+        self.field = field
+        self.source = source
+        self.val_to_send = val_to_send
+        self.icon = icon
+        if entity_type == SENSOR:
+            self.unit = unit
+        if entity_type == BINARY_SENSOR:
+            self.invert = invert
+        self._state = None
+
+
+def legacy_copy(entity):
+    return LegacyEntity(
+        entity.entity_type, entity.name, entity.attr, entity.device_class, entity.entity_category, entity.field,
+        entity.source, entity.val_to_send, entity.icon, getattr(entity, "unit", None),
+        getattr(entity, "invert", False),
+    )
+
+
+# ElectroluxLibraryEntity without __slots__, for the per instance comparison
+LegacyLibraryEntity = type("LegacyLibraryEntity", (), {
+    name: value for name, value in vars(ElectroluxLibraryEntity).items()
+    if name not in ElectroluxLibraryEntity.__slots__ + ("__slots__",)
+})
+
+
+def measure(build):
+    """Return (result, bytes still allocated by build)."""
+    tracemalloc.start()
+    before = tracemalloc.take_snapshot()
+    result = build()
+    after = tracemalloc.take_snapshot()
+    tracemalloc.stop()
+    allocated = sum(stat.size_diff for stat in after.compare_to(before, "filename"))
+    return result, allocated
+
+
+def instance_size(obj):
+    size = sys.getsizeof(obj)
+    if hasattr(obj, "__dict__"):
+        size += sys.getsizeof(obj.__dict__)
+    return size
+
+
+def main():
+    size = int(sys.argv[1]) if len(sys.argv) > 1 else 50
+    session = FakeSession(size)
+    fleet = []
+    for pnc_id, info in session.getAppliances().items():
+        payload = (session.getApplianceConnectionState(pnc_id), session.getApplianceState(pnc_id),
+                   session.getApplianceProfile(pnc_id))
+        data = ElectroluxLibraryEntity(info["alias"], *payload)
+        appliance = Appliance(info["alias"], pnc_id, info["brand"], info["model"])
+        appliance.setup(data)
+        fleet.append((info["alias"], payload, appliance))
+
+    # Names and descriptors already exist in both cases, only the entity objects are measured
+    entities = [entity for _, _, appliance in fleet for entity in appliance.entities]
+    legacy, legacy_bytes = measure(lambda: [legacy_copy(entity) for entity in entities])
+    slotted, slotted_bytes = measure(lambda: [type(entity)(entity.descriptor, entity.name, entity.source)
+                                              if entity.entity_type != BUTTON else
+                                              type(entity)(entity.descriptor, entity.name, entity.source,
+                                                           entity.val_to_send, entity.icon)
+                                              for entity in entities])
+    count = len(entities)
+    print(f"{size} appliances, {count} entities")
+    print(f"{'':<24}{'total KiB':>12}{'bytes/entity':>14}")
+    print(f"{'dict-backed entities':<24}{legacy_bytes / 1024:>12.1f}{legacy_bytes / count:>14.0f}")
+    print(f"{'slotted entities':<24}{slotted_bytes / 1024:>12.1f}{slotted_bytes / count:>14.0f}")
+    print(f"entity overhead reduced by {1 - slotted_bytes / legacy_bytes:.0%}")
+
+    name, payload, _ = fleet[0]
+    print(f"ElectroluxLibraryEntity instance: {instance_size(LegacyLibraryEntity(name, *payload))} bytes dict-backed, "
+          f"{instance_size(ElectroluxLibraryEntity(name, *payload))} bytes slotted")
+    del legacy, slotted
+
+
+if __name__ == "__main__":
+    main()
@@ -5,28 +5,58 @@ import asyncio
 import logging
 from datetime import timedelta
 
+import async_timeout
+
 from homeassistant.config_entries import ConfigEntry
 from homeassistant.core import Config
-from homeassistant.core import HomeAssistant
+from homeassistant.core import HomeAssistant, ServiceCall, callback
 from homeassistant.exceptions import ConfigEntryNotReady, ConfigEntryAuthFailed
+from homeassistant.helpers import device_registry as dr
+from homeassistant.helpers import entity_registry as er
+from homeassistant.helpers.dispatcher import async_dispatcher_send
 from homeassistant.helpers.update_coordinator import DataUpdateCoordinator
 from homeassistant.helpers.update_coordinator import UpdateFailed
+from homeassistant.util import dt as dt_util
 
 from .pyelectroluxconnect_util import pyelectroluxconnect_util
 from .api import Appliance, Appliances, ElectroluxLibraryEntity
+from .appliance_coordinator import ElectroluxApplianceCoordinator
+from .profile_cache import ProfileCache, get_profile_cache
+from .accounts import get_account_backends
+from .command_queue import ElectroluxCommandQueue
+from .fingerprint import PayloadFingerprint
+from .handoff import HandedOffSession, account_key, get_session_handoff
+from .metrics import CoordinatorMetrics
+from .scheduler import AdaptivePollScheduler
+from .session import ElectroluxSessionManager, is_auth_error
+from .snapshot import ApplianceSnapshot
+from .stream import ElectroluxStreamTransport
 from .const import CONF_PASSWORD, CONF_SCAN_INTERVAL, DEFAULT_SCAN_INTERVAL, CONF_REGION, DEFAULT_REGION
+from .const import CONF_MAX_CONCURRENCY, DEFAULT_MAX_CONCURRENCY, DEFAULT_CALL_TIMEOUT
+from .const import CONF_STREAM_URL
 from .const import CONF_LANGUAGE, DEFAULT_LANGUAGE
 from .const import CONF_USERNAME
 from .const import DOMAIN
 from .const import PLATFORMS
+from .const import SERVICE_REFRESH_PROFILES, SIGNAL_OPTIONS_UPDATED
 from .const import languages
 
 _LOGGER: logging.Logger = logging.getLogger(__package__)
 
+CLOUD_PHASES = ["login", "appliance_list", "connection_state", "appliance_state", "appliance_profile"]
+
 
 # noinspection PyUnusedLocal
 async def async_setup(hass: HomeAssistant, config: Config):
     """Set up this integration using YAML is not supported."""
+
+    async def async_refresh_profiles(call: ServiceCall) -> None:
+        """Drop cached appliance profiles and fetch them again."""
+        get_profile_cache(hass).invalidate()
+        for coordinator in set(hass.data.get(DOMAIN, {}).values()):
+            await coordinator.async_refresh_appliances()
+
+    hass.services.async_register(DOMAIN, SERVICE_REFRESH_PROFILES, async_refresh_profiles)
     return True
 
 
@@ -35,75 +65,490 @@ async def async_setup_entry(hass: HomeAssistant, entry: ConfigEntry):
     if hass.data.get(DOMAIN) is None:
         hass.data.setdefault(DOMAIN, {})
 
-    if entry.options.get(CONF_SCAN_INTERVAL):
-        update_interval = timedelta(seconds=entry.options[CONF_SCAN_INTERVAL])
-    else:
-        update_interval = timedelta(seconds=DEFAULT_SCAN_INTERVAL)
+    # Entries of the same account share its coordinator
+    backends = get_account_backends(hass)
+    key = account_key(entry.data)
+    coordinator = await backends.async_acquire(key, lambda: async_create_account(hass, entry))
+
+    try:
+        await async_migrate_appliance_ids(hass, entry, coordinator.data["appliances"])
+
+        hass.data[DOMAIN][entry.entry_id] = coordinator
+        coordinator.entry_options[entry.entry_id] = dict(entry.options)
+
+        coordinator.platforms.extend(platform for platform in PLATFORMS if platform not in coordinator.platforms)
+        await hass.config_entries.async_forward_entry_setups(entry, PLATFORMS)
+        # Entities listen to their appliance coordinator, this keeps the appliance list refreshed
+        entry.async_on_unload(coordinator.async_add_listener(lambda: None))
+
+        if coordinator.stream is None:
+            await coordinator.async_set_stream_url(entry.options.get(CONF_STREAM_URL))
+    except Exception:
+        # The entry does not use the account coordinator, stop it if no other entry does
+        hass.data[DOMAIN].pop(entry.entry_id, None)
+        coordinator.entry_options.pop(entry.entry_id, None)
+        if backends.release(key):
+            await coordinator.async_stop()
+        raise
+
+    entry.async_on_unload(entry.add_update_listener(async_options_updated))
+    return True
+
+
+async def async_create_account(hass: HomeAssistant, entry: ConfigEntry) -> "ElectroluxStatusDataUpdateCoordinator":
+    """Create the account coordinator of an entry and get its first appliance data."""
+    update_interval = scan_interval(entry.options)
 
     username = entry.data.get(CONF_USERNAME)
     password = entry.data.get(CONF_PASSWORD)
     region = entry.data.get(CONF_REGION, DEFAULT_REGION)
     language = languages.get(entry.data.get(CONF_LANGUAGE, DEFAULT_LANGUAGE),"eng")
 
-    client = pyelectroluxconnect_util.get_session(username, password, region, language)
+    handed_off = get_session_handoff(hass).take(account_key(entry.data))
+    if handed_off is not None:
+        client = handed_off.client
+    else:
+        client = pyelectroluxconnect_util.get_session(username, password, region, language)
 
-    coordinator = ElectroluxStatusDataUpdateCoordinator(hass, client=client, update_interval=update_interval)
-    if not await coordinator.async_login():
-        raise ConfigEntryAuthFailed
+    max_concurrency = entry.options.get(CONF_MAX_CONCURRENCY, DEFAULT_MAX_CONCURRENCY)
 
-    await coordinator.async_config_entry_first_refresh()
+    profile_cache = get_profile_cache(hass)
+    await profile_cache.async_load()
 
-    if not coordinator.last_update_success:
-        raise ConfigEntryNotReady
+    snapshot = ApplianceSnapshot(hass, account_key(entry.data))
+    restored = await snapshot.async_load()
 
-    hass.data[DOMAIN][entry.entry_id] = coordinator
+    coordinator = ElectroluxStatusDataUpdateCoordinator(hass, client=client, update_interval=update_interval,
+                                                        max_concurrency=max_concurrency, profile_cache=profile_cache,
+                                                        snapshot=snapshot)
+    if handed_off is not None:
+        coordinator.async_adopt_session(handed_off)
+    if restored is not None and coordinator.async_restore(*restored):
+        # Warm start: entities are created from the snapshot, login and first refresh run in the background
+        _LOGGER.debug("Restored %s appliances from the snapshot", len(coordinator.data["appliances"].found_appliances))
+        # Not tracked by the Home Assistant startup, which does not wait for the cloud
+        coordinator.first_refresh = hass.async_create_background_task(
+            coordinator.async_warm_start(entry), f"{DOMAIN} warm start"
+        )
+    else:
+        try:
+            if not await coordinator.async_login():
+                raise ConfigEntryAuthFailed
 
-    coordinator.platforms.extend(PLATFORMS)
-    await hass.config_entries.async_forward_entry_setups(entry, PLATFORMS)
+            await coordinator.async_config_entry_first_refresh()
 
-    entry.add_update_listener(async_reload_entry)
-    return True
+            if not coordinator.last_update_success:
+                raise ConfigEntryNotReady
+        except Exception:
+            # The setup is retried with a new coordinator, this one must not keep polling
+            await coordinator.async_stop()
+            raise
+    return coordinator
+
+
+def scan_interval(options) -> timedelta:
+    if options.get(CONF_SCAN_INTERVAL):
+        return timedelta(seconds=options[CONF_SCAN_INTERVAL])
+    return timedelta(seconds=DEFAULT_SCAN_INTERVAL)
+
+
+async def async_migrate_appliance_ids(hass: HomeAssistant, entry: ConfigEntry, appliances: Appliances) -> None:
+    """Move devices and entities registered under the appliance alias over to the PNC id."""
+    renamed = [
+        appliance for appliance in appliances.found_appliances.values() if appliance.name != appliance.pnc_id
+    ]
+    # Longest alias first, so "-Washer" does not match an entity of "Big-Washer"
+    renamed.sort(key=lambda appliance: len(appliance.name), reverse=True)
+    if not renamed:
+        return
+
+    device_registry = dr.async_get(hass)
+    for appliance in renamed:
+        device = device_registry.async_get_device({(DOMAIN, appliance.name)})
+        if device is not None and device_registry.async_get_device({(DOMAIN, appliance.pnc_id)}) is None:
+            device_registry.async_update_device(device.id, new_identifiers={(DOMAIN, appliance.pnc_id)})
+
+    entity_registry = er.async_get(hass)
+
+    @callback
+    def _migrate_unique_id(entity_entry: er.RegistryEntry):
+        for appliance in renamed:
+            suffix = f"-{appliance.name}"
+            if entity_entry.unique_id.endswith(suffix):
+                new_unique_id = f"{entity_entry.unique_id[:-len(suffix)]}-{appliance.pnc_id}"
+                if entity_registry.async_get_entity_id(entity_entry.domain, DOMAIN, new_unique_id):
+                    return None
+                return {"new_unique_id": new_unique_id}
+        return None
+
+    await er.async_migrate_entries(hass, entry.entry_id, _migrate_unique_id)
 
 
 class ElectroluxStatusDataUpdateCoordinator(DataUpdateCoordinator):
-    """Class to manage fetching data from the API."""
+    """Account coordinator: discover the appliances and fetch them for their appliance coordinators.
+
+    Every appliance has its own ElectroluxApplianceCoordinator, polled on its own schedule, that
+    its entities subscribe to. This coordinator refreshes the appliance list every scan interval.
+    """
 
-    def __init__(self, hass: HomeAssistant, client: Session, update_interval: timedelta) -> None:
+    def __init__(self, hass: HomeAssistant, client: Session, update_interval: timedelta,
+                 max_concurrency: int = DEFAULT_MAX_CONCURRENCY, profile_cache: ProfileCache = None,
+                 snapshot: ApplianceSnapshot = None) -> None:
         """Initialize."""
         self.api = client
+        self.profile_cache = profile_cache or get_profile_cache(hass)
+        self.snapshot = snapshot
+        self.first_refresh = None
+        self.metrics = CoordinatorMetrics()
+        self.session = ElectroluxSessionManager(hass, client, metrics=self.metrics)
+        self.commands = ElectroluxCommandQueue(hass, self.session, self.metrics)
         self.platforms = []
+        self.scheduler = AdaptivePollScheduler(update_interval)
+        self.stream = None
+        self.polling_paused = False
+        self.appliance_coordinators = {}
+        self._appliances = {}
+        self._appliances_json = None
+        self._prefetched_appliances_json = None
+        self._fingerprints = {}
+        self.fingerprint_hits = 0
+        self.fingerprint_partial = 0
+        self.fingerprint_misses = 0
+        self.suppressed_writes = 0
+        self.max_concurrency = max_concurrency
+        self._semaphore = asyncio.Semaphore(max_concurrency)
+        # Last options of each entry sharing the coordinator
+        self.entry_options = {}
+
+        super().__init__(hass, _LOGGER, name=DOMAIN, update_interval=self.scheduler.idle_interval)
+
+    @callback
+    def async_adopt_session(self, handed_off: HandedOffSession) -> None:
+        """Start from a client logged in by the config flow or by the previous setup of the entry."""
+        self.session.adopt(handed_off.token_expires)
+        self._prefetched_appliances_json = handed_off.appliances_json
 
-        super().__init__(hass, _LOGGER, name=DOMAIN, update_interval=update_interval)
+    def handoff_session(self) -> HandedOffSession:
+        """Return the logged in client and appliance list for the next setup of the account."""
+        return HandedOffSession(self.api, self.session.token_expires, self._appliances_json)
 
     async def async_login(self) -> bool:
         try:
-            await self.hass.async_add_executor_job(self.api.login)
+            await self.session.async_login()
         except Exception as ex:
             _LOGGER.error("Could not log in to ElectroluxStatus, %s", ex)
             return False
         return True
 
-    async def _async_update_data(self):
-        """Update data via library."""
-        await self.async_login()
+    async def async_warm_start(self, entry: ConfigEntry) -> None:
+        """Log in and poll the restored appliances, asking for the password again if the cloud rejects it."""
+        try:
+            await self.session.async_login()
+        except Exception as ex:  # pylint: disable=broad-except
+            if is_auth_error(ex):
+                _LOGGER.error("ElectroluxStatus rejected the credentials of %s, %s", entry.title, ex)
+                entry.async_start_reauth(self.hass)
+                return
+            _LOGGER.warning("Could not log in to ElectroluxStatus, the polls will try again: %s", ex)
+        await self.async_refresh_appliances()
+
+    async def async_stop(self) -> None:
+        """Stop the background first refresh, the push stream, the command queue, the appliance
+        coordinators, and write the snapshot."""
+        if self.first_refresh is not None and not self.first_refresh.done():
+            self.first_refresh.cancel()
+        if self.stream is not None:
+            await self.stream.async_stop()
+        await self.commands.async_stop()
+        for appliance_coordinator in self.appliance_coordinators.values():
+            appliance_coordinator.async_stop()
+        if self.snapshot is not None:
+            await self.snapshot.async_flush()
+
+    @callback
+    def async_set_update_interval(self, update_interval: timedelta) -> None:
+        """Change the polling interval of the running coordinator, None pauses polling."""
+        self.update_interval = update_interval
+        if self._listeners:
+            self._schedule_refresh()
+
+    async def async_apply_options(self, options) -> None:
+        """Apply changed options to the running coordinator, without reloading the entry.
+
+        Only the options in ``options`` are applied, the ones an entry did not change stay
+        as another entry of the account may have set them.
+        """
+        interval = scan_interval(options) if CONF_SCAN_INTERVAL in options else self.scheduler.idle_interval
+        if interval != self.scheduler.idle_interval:
+            _LOGGER.debug("ElectroluxStatus scan interval changed to %s", interval)
+            # The appliance coordinators below schedule their next poll from now
+            self.scheduler.set_interval(interval, dt_util.utcnow())
+            self.async_set_update_interval(interval)
+            for pnc_id, appliance_coordinator in self.appliance_coordinators.items():
+                appliance_coordinator.async_set_update_interval(
+                    None if self.polling_paused else self.scheduler.interval(pnc_id)
+                )
+        max_concurrency = options.get(CONF_MAX_CONCURRENCY, self.max_concurrency)
+        if max_concurrency != self.max_concurrency:
+            _LOGGER.debug("ElectroluxStatus concurrency changed to %s", max_concurrency)
+            # Calls already waiting keep the previous limit
+            self._semaphore = asyncio.Semaphore(max_concurrency)
+            self.max_concurrency = max_concurrency
+        if CONF_STREAM_URL in options:
+            await self.async_set_stream_url(options[CONF_STREAM_URL])
+
+    async def async_set_stream_url(self, url) -> None:
+        """Connect to the push stream at ``url``, or only poll when there is none."""
+        url = url or None
+        if self.stream is not None:
+            if self.stream.url == url:
+                return
+            await self.stream.async_stop()
+            self.stream = None
+            if self.polling_paused:
+                self.async_stream_connected(False)
+        if url is not None:
+            self.stream = ElectroluxStreamTransport(self.hass, self, url)
+            self.stream.async_start()
+
+    @callback
+    def async_stream_connected(self, connected: bool) -> None:
+        """Poll the appliances only while the push stream is down."""
+        self.polling_paused = connected
+        if connected:
+            _LOGGER.info("ElectroluxStatus stream connected, pausing polling")
+        else:
+            _LOGGER.info("ElectroluxStatus stream disconnected, falling back to polling")
+        for pnc_id, appliance_coordinator in self.appliance_coordinators.items():
+            appliance_coordinator.async_set_update_interval(None if connected else self.scheduler.interval(pnc_id))
+        if not connected:
+            self.hass.async_create_task(self.async_refresh_appliances())
+
+    @callback
+    def async_restore(self, appliances_json, payloads) -> bool:
+        """Build the appliances from a saved snapshot, return false if it had none."""
         found_appliances = {}
+        for appliance, appliance_json in appliances_json.items():
+            payload = payloads.get(appliance)
+            if payload is None:
+                continue
+            try:
+                found_appliances[appliance] = self._build_appliance(
+                    appliance, appliance_json, payload["status"], payload["states"], payload["profile"]
+                )
+            except Exception as ex:  # pylint: disable=broad-except
+                _LOGGER.warning("Could not restore appliance %s from the snapshot: %r", appliance, ex)
+        if not found_appliances:
+            return False
+        self._appliances = found_appliances
+        # The saved list is used until the cloud answers
+        self._appliances_json = appliances_json
+        self.appliance_coordinators = {
+            pnc_id: ElectroluxApplianceCoordinator(self.hass, self, pnc_id, appliance)
+            for pnc_id, appliance in found_appliances.items()
+        }
+        self.data = {"appliances": Appliances(found_appliances)}
+        return True
+
+    async def async_refresh_appliances(self) -> None:
+        """Poll every appliance right away."""
+        await asyncio.gather(*[
+            appliance_coordinator.async_refresh() for appliance_coordinator in self.appliance_coordinators.values()
+        ])
+
+    @callback
+    def async_apply_delta(self, delta: dict) -> None:
+        """Apply a pushed state delta to the cached state of one appliance."""
+        appliance = self._appliances.get(delta.get("pncId"))
+        if appliance is None or appliance.data is None:
+            return
+        data = appliance.data
+        states = dict(data.states)
+        for key, fields in delta.get("states", {}).items():
+            states[key] = {**states.get(key, {}), **fields}
+        status = {**data.status, **delta.get("status", {})}
+        with self.metrics.timer("setup"):
+            appliance.update(ElectroluxLibraryEntity(data.name, status, states, data.profile))
+        self.async_publish(appliance, appliance.changed)
+
+    @callback
+    def async_publish(self, appliance: Appliance, changed) -> None:
+        """Notify the entities of one appliance changed outside of a poll."""
+        appliance_coordinator = self.appliance_coordinators.get(appliance.pnc_id)
+        if not changed or appliance_coordinator is None:
+            return
+        # The entities no longer match the last polled payload
+        self._fingerprints.pop(appliance.pnc_id, None)
+        appliance.changed = set(changed)
+        appliance_coordinator.async_update_listeners()
+
+    async def async_request_appliance_refresh(self, pnc_id) -> None:
+        """Poll a single appliance soon, merging requests made in quick succession."""
+        appliance_coordinator = self.appliance_coordinators.get(pnc_id)
+        if appliance_coordinator is not None:
+            await appliance_coordinator.async_request_refresh()
+
+    @callback
+    def async_update_listeners(self) -> None:
+        with self.metrics.timer("dispatch"):
+            super().async_update_listeners()
+
+    def diagnostic_values(self) -> dict:
+        """Return the values shown by the diagnostic sensors."""
+        refresh = self.metrics.phase("refresh")
+        cloud = [self.metrics.phase(phase) for phase in CLOUD_PHASES]
+        return {
+            "refresh_p50": refresh.percentile(50),
+            "refresh_p95": refresh.percentile(95),
+            "refresh_max": refresh.percentile(100),
+            "cloud_calls": sum(stats.calls for stats in cloud),
+            "cloud_errors": sum(stats.errors for stats in cloud),
+            "logins": self.session.logins,
+            "suppressed_writes": self.suppressed_writes,
+            "command_queue_depth": self.commands.depth,
+            "command_latency_p95": self.metrics.phase("command").percentile(95),
+        }
+
+    async def _async_call(self, phase, func, *args):
+        """Run a blocking cloud call, bounded by the concurrency limit.
+
+        The timeout starts once the call got its turn, waiting in the queue does not count.
+        """
+        async with self._semaphore:
+            with self.metrics.timer(phase):
+                async with async_timeout.timeout(DEFAULT_CALL_TIMEOUT):
+                    return await self.session.async_call(func, *args)
+
+    async def _async_fetch_appliance(self, appliance, appliance_json) -> Appliance:
+        """Fetch connection state, state and profile of a single appliance."""
+        fingerprint = ProfileCache.fingerprint(appliance_json)
+        appliance_profile = self.profile_cache.get(appliance, fingerprint)
+        calls = [
+            self._async_call("connection_state", self.api.getApplianceConnectionState, appliance),
+            self._async_call("appliance_state", self.api.getApplianceState, appliance),
+        ]
+        if appliance_profile is None:
+            calls.append(self._async_call("appliance_profile", self.api.getApplianceProfile, appliance))
+        connection_state, appliance_state, *fetched_profile = await asyncio.gather(*calls)
+        if not fetched_profile and self.profile_cache.sources_changed(appliance, appliance_state):
+            _LOGGER.debug("Sources of appliance %s changed, fetching its profile again", appliance)
+            fetched_profile = [await self._async_call("appliance_profile", self.api.getApplianceProfile, appliance)]
+        if fetched_profile:
+            appliance_profile = fetched_profile[0]
+            self.profile_cache.set(appliance, fingerprint, appliance_profile, appliance_state)
+        return self._build_appliance(appliance, appliance_json, connection_state, appliance_state, appliance_profile)
+
+    def _build_appliance(self, appliance, appliance_json, connection_state, appliance_state,
+                         appliance_profile) -> Appliance:
+        """Set up a new appliance from its payloads, or update the known one in place.
+
+        Payloads identical to the previous ones are not parsed again, and when only some states
+        changed only the entities of these states are evaluated again.
+        """
+        appliance_name = appliance_json['alias'] or appliance
+        appliance_model = appliance_json['model'] or appliance_json['pnc']
+        with self.metrics.timer("setup"):
+            app = self._appliances.get(appliance)
+            previous = self._fingerprints.get(appliance)
+            fingerprint = self._fingerprints[appliance] = PayloadFingerprint(
+                (appliance_name, appliance_model), connection_state, appliance_state, appliance_profile, previous
+            )
+            names = previous.changed_names(fingerprint) if app is not None and previous is not None else None
+            if names is not None and not names:
+                self.fingerprint_hits += 1
+                app.changed = set()
+                return app
+            if names is None:
+                self.fingerprint_misses += 1
+            else:
+                self.fingerprint_partial += 1
+            data = ElectroluxLibraryEntity(appliance_name, connection_state, appliance_state, appliance_profile)
+            if app is None:
+                app = Appliance(appliance_name, appliance, appliance_json['brand'], appliance_model,
+                                appliance_json.get('sn'))
+                app.setup(data)
+            else:
+                app.name = appliance_name
+                app.model = appliance_model
+                app.update(data, names)
+        return app
+
+    async def async_update_appliance(self, pnc_id) -> Appliance:
+        """Poll one appliance for its coordinator.
+
+        When the poll fails the last known good appliance is returned and its next poll backs off.
+        """
+        now = dt_util.utcnow()
+        appliance_json = (self._appliances_json or {}).get(pnc_id)
+        if appliance_json is None:
+            raise UpdateFailed(f"Appliance {pnc_id} is not in the appliance list")
         try:
-            appliances_json = await self.hass.async_add_executor_job(self.api.getAppliances)
-            for appliance in appliances_json:
-                connection_state = await self.hass.async_add_executor_job(self.api.getApplianceConnectionState, appliance)
-                appliance_state = await self.hass.async_add_executor_job(self.api.getApplianceState, appliance)
-                appliance_profile = await self.hass.async_add_executor_job(self.api.getApplianceProfile, appliance)
-                appliance_name = appliances_json[appliance]['alias'] or appliance
-                appliance_model = appliances_json[appliance]['model'] or appliances_json[appliance]['pnc']
-                app = Appliance(appliance_name, appliance, appliances_json[appliance]['brand'], appliance_model)
-                app.setup(ElectroluxLibraryEntity(appliance_name, connection_state, appliance_state, appliance_profile))
-                found_appliances[appliance_name] = app
-            return {
-                "appliances": Appliances(found_appliances)
-            }
+            with self.metrics.timer("refresh"):
+                appliance = await self._async_fetch_appliance(pnc_id, appliance_json)
+        except Exception as ex:  # pylint: disable=broad-except
+            failures = self.scheduler.record_failure(pnc_id, now)
+            appliance = self._appliances.get(pnc_id)
+            if appliance is None:
+                raise UpdateFailed(f"Could not update appliance {pnc_id}: {ex!r}") from ex
+            _LOGGER.warning("Could not update appliance %s: %r", pnc_id, ex)
+            # Its entities become unavailable after UNAVAILABLE_AFTER_FAILURES failed polls
+            appliance.failures = failures
+            appliance.changed = set()
+            return appliance
+        appliance.failures = 0
+        self.scheduler.record_success(pnc_id, appliance, now)
+        self._appliances[pnc_id] = appliance
+        if self.snapshot is not None:
+            self.snapshot.async_schedule_save(self._appliances_json, self._appliances)
+        return appliance
+
+    async def _async_get_appliances(self):
+        if self._prefetched_appliances_json is not None:
+            # Fetched by whoever handed the session over
+            self._appliances_json, self._prefetched_appliances_json = self._prefetched_appliances_json, None
+            return self._appliances_json
+        try:
+            with self.metrics.timer("appliance_list"):
+                self._appliances_json = await self.session.async_call(self.api.getAppliances)
         except Exception as exception:
-            _LOGGER.exception(exception)
-            raise UpdateFailed() from exception
+            if self._appliances_json is None:
+                _LOGGER.exception(exception)
+                raise UpdateFailed() from exception
+            # Keep polling the appliances already known
+            _LOGGER.warning("Could not update the appliance list: %r", exception)
+        return self._appliances_json
+
+    async def _async_update_data(self):
+        """Refresh the appliance list, adding and removing appliance coordinators."""
+        appliances_json = await self._async_get_appliances()
+
+        for pnc_id in self.appliance_coordinators.keys() - appliances_json.keys():
+            _LOGGER.info("Appliance %s was removed from the account", pnc_id)
+            self.appliance_coordinators.pop(pnc_id).async_stop()
+            self._appliances.pop(pnc_id, None)
+            self._fingerprints.pop(pnc_id, None)
+            self.scheduler.forget(pnc_id)
+        for pnc_id in appliances_json.keys() - self.appliance_coordinators.keys():
+            self.appliance_coordinators[pnc_id] = ElectroluxApplianceCoordinator(self.hass, self, pnc_id)
+
+        # Appliances never polled successfully have no entities polling them yet
+        await asyncio.gather(*[
+            appliance_coordinator.async_refresh()
+            for appliance_coordinator in self.appliance_coordinators.values() if appliance_coordinator.data is None
+        ])
+
+        found_appliances = {
+            pnc_id: appliance_coordinator.data
+            for pnc_id, appliance_coordinator in self.appliance_coordinators.items()
+            if appliance_coordinator.data is not None
+        }
+        # Only fail the refresh when there is nothing to show at all
+        if appliances_json and not found_appliances:
+            raise UpdateFailed("Could not update any appliance")
+
+        return {
+            "appliances": Appliances(found_appliances)
+        }
 
 
 async def async_unload_entry(hass: HomeAssistant, entry: ConfigEntry) -> bool:
@@ -120,11 +565,33 @@ async def async_unload_entry(hass: HomeAssistant, entry: ConfigEntry) -> bool:
     )
     if unloaded:
         hass.data[DOMAIN].pop(entry.entry_id)
+        coordinator.entry_options.pop(entry.entry_id, None)
+        # Stop the account coordinator once no entry uses it anymore
+        if get_account_backends(hass).release(account_key(entry.data)):
+            await coordinator.async_stop()
+            if coordinator.session.token_valid:
+                # A reload sets the entry up again right away with the same client
+                get_session_handoff(hass).put(account_key(entry.data), coordinator.handoff_session())
 
     return unloaded
 
 
-async def async_reload_entry(hass: HomeAssistant, entry: ConfigEntry) -> None:
-    """Reload config entry."""
-    await async_unload_entry(hass, entry)
-    await async_setup_entry(hass, entry)
+async def async_remove_entry(hass: HomeAssistant, entry: ConfigEntry) -> None:
+    """Drop the warm start snapshot once the last entry of its account is removed."""
+    key = account_key(entry.data)
+    for other in hass.config_entries.async_entries(DOMAIN):
+        if other.entry_id != entry.entry_id and account_key(other.data) == key:
+            return
+    await ApplianceSnapshot(hass, key).async_remove()
+
+
+async def async_options_updated(hass: HomeAssistant, entry: ConfigEntry) -> None:
+    """Apply changed options to the running entry instead of reloading it."""
+    coordinator = hass.data[DOMAIN][entry.entry_id]
+    previous = coordinator.entry_options.get(entry.entry_id, {})
+    coordinator.entry_options[entry.entry_id] = dict(entry.options)
+    await coordinator.async_apply_options(
+        {key: value for key, value in entry.options.items() if previous.get(key) != value}
+    )
+    # The platforms add or remove the entities that depend on the options
+    async_dispatcher_send(hass, SIGNAL_OPTIONS_UPDATED.format(entry.entry_id), entry.options)
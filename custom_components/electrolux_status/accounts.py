@@ -0,0 +1,59 @@
+"""Account coordinators shared between config entries for Electrolux Status."""
+import asyncio
+import logging
+
+from homeassistant.core import HomeAssistant
+
+from .const import DOMAIN_DATA
+
+_LOGGER: logging.Logger = logging.getLogger(__package__)
+
+
+def get_account_backends(hass: HomeAssistant) -> "AccountBackends":
+    """Return the account backends shared by all config entries."""
+    domain_data = hass.data.setdefault(DOMAIN_DATA, {})
+    if "accounts" not in domain_data:
+        domain_data["accounts"] = AccountBackends()
+    return domain_data["accounts"]
+
+
+class AccountBackends:
+    """One account coordinator per account, region and language, reference counted by the config entries.
+
+    Entries of the same account share its session, appliance coordinators and polls
+    instead of each fetching everything again.
+    """
+
+    def __init__(self) -> None:
+        """Initialize."""
+        self._backends = {}
+        self._references = {}
+        self._locks = {}
+
+    async def async_acquire(self, key, create):
+        """Return the coordinator of the account and count one more user, created with ``create()`` if there is none.
+
+        Entries set up at the same time wait for the coordinator the first one is creating. If
+        creating it fails, the next waiting entry tries again.
+        """
+        async with self._locks.setdefault(key, asyncio.Lock()):
+            coordinator = self._backends.get(key)
+            if coordinator is not None:
+                self._references[key] += 1
+                _LOGGER.debug("Sharing the ElectroluxStatus account of %s (%s entries)", key[0], self._references[key])
+                return coordinator
+            coordinator = await create()
+            self._backends[key] = coordinator
+            self._references[key] = 1
+            return coordinator
+
+    def release(self, key) -> bool:
+        """Count one user less, return true if it was the last one and the coordinator can be stopped."""
+        if key not in self._backends:
+            return False
+        self._references[key] -= 1
+        if self._references[key] > 0:
+            return False
+        del self._backends[key]
+        del self._references[key]
+        return True
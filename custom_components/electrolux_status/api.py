@@ -1,24 +1,62 @@
 import logging
 import math
+import time
 
-from homeassistant.components.binary_sensor import BinarySensorDeviceClass
-from homeassistant.components.sensor import SensorDeviceClass
-from homeassistant.helpers.entity import EntityCategory
-
-from .const import BINARY_SENSOR, SENSOR, BUTTON, icon_mapping
-from .const import sensors, sensors_binary
+from .const import BINARY_SENSOR, SENSOR, BUTTON, icon_mapping, command_optimistic_states
+from .const import UNAVAILABLE_AFTER_FAILURES, interpolated_time_sensors
+from .catalogue import EntityDescriptor, descriptors_for
+from .catalogue import COMMAND_DESCRIPTOR, LINK_QUALITY_DESCRIPTOR, SSID_DESCRIPTOR, STATUS_DESCRIPTOR
 
 _LOGGER: logging.Logger = logging.getLogger(__package__)
 
 HEADERS = {"Content-type": "application/json; charset=UTF-8"}
 
+BINARY_ON_STATES = (1, 'enabled', True, 'Connected', 'connect')
+
 
 class ElectroluxLibraryEntity:
+    __slots__ = ("name", "status", "states", "profile", "_states_index", "_containers_index", "_sources_index",
+                 "_names_index", "_profile_index", "_commands_index")
+
     def __init__(self, name, status, last_states, appliance_profile):
         self.name = name
         self.status: dict = status
         self.states = last_states
         self.profile = appliance_profile
+        self._build_index()
+
+    def _build_index(self):
+        # (name, source) -> (position, state), container name -> (position, container state),
+        # name -> sources. Positions keep the "first state wins" order of a linear scan.
+        self._states_index = {}
+        self._containers_index = {}
+        self._sources_index = {}
+        self._names_index = {}
+        for position, state in enumerate(self.states.values()):
+            name = state.get("name")
+            source = state.get("source")
+            self._states_index.setdefault((name, source), (position, state))
+            self._sources_index.setdefault(name, set()).add(source)
+            self._names_index.setdefault(source, set()).add(name)
+            containers = state.get("container", [])
+            for c in containers:
+                self._containers_index.setdefault(containers[c].get("name"), (position, containers[c]))
+        self._profile_index = {}
+        self._commands_index = {}
+        for item in self.profile.values():
+            source = item.get("source")
+            self._profile_index.setdefault(source, set()).add(item.get("name"))
+            if item.get("name") == "ExecuteCommand":
+                self._commands_index.setdefault(source, item.get("steps"))
+
+    def _find_state(self, attr_name, source):
+        state = self._states_index.get((attr_name, source))
+        container = self._containers_index.get(attr_name)
+        if state is None:
+            return container[1] if container else None
+        if container is None or state[0] <= container[0]:
+            return state[1]
+        return container[1]
 
     def get_name(self):
         return self.name
@@ -28,14 +66,14 @@ class ElectroluxLibraryEntity:
             return self.time_to_end_in_minutes(attr_name, field, source)
         if attr_name in self.status:
             return self.status.get(attr_name)
-        if attr_name in [self.states[k].get("name") for k in self.states]:
+        if attr_name in self._sources_index:
             val = self.get_from_states(attr_name, field, source)
             if field == "container":
                 if val["1"]["name"] == "Coefficient" and val["3"]["name"] == "Exponent":
                     return val["1"]["numberValue"] * (10 ** val["3"]["numberValue"])
             else:
                 return val
-        if attr_name in [self.states[st]["container"][cr].get("name") for st in self.states for cr in self.states[st].get("container", [])]:
+        if attr_name in self._containers_index:
             return self.get_from_states(attr_name, field, source)
         return None
 
@@ -48,13 +86,10 @@ class ElectroluxLibraryEntity:
         return None
 
     def get_from_states(self, attr_name, field, source):
-        for k in self.states:
-            if attr_name == self.states[k].get("name") and source == self.states[k].get("source"):
-                return self._get_states(self.states[k], field) if field else self._get_states(self.states[k])
-            for c in self.states[k].get("container", []):
-                if attr_name == self.states[k]["container"][c].get("name"):
-                    return self._get_states(self.states[k]["container"][c], field) if field else self._get_states(self.states[k]["container"][c])
-        return None
+        state = self._find_state(attr_name, source)
+        if state is None:
+            return None
+        return self._get_states(state, field) if field else self._get_states(state)
 
     @staticmethod
     def _get_states(states, field=None):
@@ -80,43 +115,31 @@ class ElectroluxLibraryEntity:
                 return states.get("numberValue")
 
     def get_sensor_name(self, attr_name, source):
-        for k in self.states:
-            if attr_name == self.states[k].get("name") and source == self.states[k].get("source"):
-                if "nameTransl" in self.states[k].keys():
-                    return self.states[k].get("nameTransl").strip(" :.")
-                else:
-                    return self.states[k].get("name").strip(" :.")
-            if "container" in self.states[k]:
-                for c in self.states[k].get("container", []):
-                    if attr_name == self.states[k]["container"][c].get("name"):
-                        if "nameTransl" in self.states[k]["container"][c].keys():
-                            return self.states[k]["container"][c].get("nameTransl").strip(" :.")
-                        else:
-                            return self.states[k]["container"][c].get("name").strip(" :.")
-        return None
+        state = self._find_state(attr_name, source)
+        if state is None:
+            return None
+        if "nameTransl" in state.keys():
+            return state.get("nameTransl").strip(" :.")
+        return state.get("name").strip(" :.")
 
     def value_exists(self, attr_name, source):
-        _container_attr = []
-        for k in self.states:
-            for c in self.states[k].get("container", []):
-                _container_attr.append(self.states[k]["container"][c].get("name"))
         return (attr_name in self.status) or \
-            (attr_name in [self.states[k].get("name") for k in self.states if self.states[k].get("source") == source]) or \
-            (attr_name in [self.profile[k].get("name") for k in self.profile if self.profile[k].get("source") == source]) or \
-            (attr_name in _container_attr)
+            ((attr_name, source) in self._states_index) or \
+            (attr_name in self._profile_index.get(source, ())) or \
+            (attr_name in self._containers_index)
+
+    def names(self, source):
+        """Return every attribute name value_exists accepts for the source."""
+        return self._names_index.get(source, set()) | self._profile_index.get(source, set()) | \
+            self._containers_index.keys() | self.status.keys()
 
     def sources_list(self):
         return list(
-            {self.states[k].get("source") for k in self.states if self.states[k].get("source") not in ["NIU", "APL"]}
+            {source for sources in self._sources_index.values() for source in sources if source not in ["NIU", "APL"]}
         )
 
     def commands_list(self, source):
-        commands = list(self.profile[k].get("steps") for k in self.profile if
-                         self.profile[k].get("source") == source and self.profile[k].get("name") == "ExecuteCommand")
-        if len(commands) > 0:
-            return commands[0]
-        else:
-            return {}
+        return self._commands_index.get(source) or {}
 
     def get_command_name(self, command_desc):
         if "transl" in command_desc:
@@ -125,8 +148,12 @@ class ElectroluxLibraryEntity:
             return command_desc["key"]
         return None
 
+    def catalogue_key(self):
+        """Return what Appliance.setup derives the entity set and names from, apart from the profile."""
+        return self.name, frozenset(self._states_index), frozenset(self._containers_index), frozenset(self.status)
+
     def get_suffix(self, attr_name, source):
-        res = list({self.states[k].get("source") for k in self.states if self.states[k].get("name") == attr_name})
+        res = self._sources_index.get(attr_name, ())
         if len(res) == 1:
             return ""
         else:
@@ -136,145 +163,209 @@ class ElectroluxLibraryEntity:
 
 
 class ApplianceEntity:
+    """Mutable state cell of an appliance entity, described by a shared ``EntityDescriptor``."""
+
+    __slots__ = ("descriptor", "name", "source", "_state", "_key")
     entity_type = None
+    val_to_send = None
+    icon = None
 
-    def __init__(self, name, attr, device_class=None, entity_category=None, field=None, source=None) -> None:
-        self.attr = attr
+    def __init__(self, descriptor: EntityDescriptor, name, source) -> None:
+        self.descriptor = descriptor
         self.name = name
-        self.device_class = device_class
-        self.entity_category = entity_category
-        self.field = field
         self.source = source
-        self.val_to_send = None
-        self.icon = None
         self._state = None
+        self._key = (self.entity_type, descriptor.attr, source, self.val_to_send)
+
+    @property
+    def attr(self):
+        return self.descriptor.attr
+
+    @property
+    def device_class(self):
+        return self.descriptor.device_class
+
+    @property
+    def entity_category(self):
+        return self.descriptor.entity_category
+
+    @property
+    def field(self):
+        return self.descriptor.field
+
+    @property
+    def key(self):
+        return self._key
 
     def setup(self, data: ElectroluxLibraryEntity):
-        self._state = data.get_value(self.attr, self.field, self.source)
+        self._state = data.get_value(self.descriptor.attr, self.descriptor.field, self.source)
         return self
 
+    def update(self, data: ElectroluxLibraryEntity) -> bool:
+        """Refresh the state in place, return true if it changed."""
+        state = data.get_value(self.descriptor.attr, self.descriptor.field, self.source)
+        if state == self._state:
+            return False
+        self._state = state
+        return True
+
     def clear_state(self):
         self._state = None
 
 
 class ApplianceSensor(ApplianceEntity):
+    __slots__ = ()
     entity_type = SENSOR
 
-    def __init__(self, name, attr, unit=None, device_class=None, entity_category=None, field=None, source=None) -> None:
-        super().__init__(name, attr, device_class, entity_category, field, source)
-        self.unit = unit
+    @property
+    def unit(self):
+        return self.descriptor.unit
 
     @property
     def state(self):
         return self._state
 
 
+class ApplianceTimeSensor(ApplianceSensor):
+    """Minutes sensor that keeps counting between polls while the appliance runs."""
+
+    __slots__ = ("_anchor_state", "_anchored_at")
+
+    def __init__(self, descriptor: EntityDescriptor, name, source) -> None:
+        super().__init__(descriptor, name, source)
+        self._anchor_state = None
+        self._anchored_at = 0.0
+
+    def estimate(self, appliance_state, now: float = None):
+        """Return the polled minutes moved by the time elapsed since they were read.
+
+        The count starts again from the polled value whenever it changes and stays put
+        while ``appliance_state`` is not one the time moves in.
+        """
+        now = time.monotonic() if now is None else now
+        direction, states = interpolated_time_sensors[self.descriptor.attr]
+        moving = appliance_state in states
+        if self._state != self._anchor_state or not moving:
+            self._anchor_state = self._state
+            self._anchored_at = now
+        if not moving or isinstance(self._state, bool) or not isinstance(self._state, int) or self._state < 0:
+            return self._state
+        return max(0, self._state + direction * int((now - self._anchored_at) // 60))
+
+
 class ApplianceBinary(ApplianceEntity):
+    __slots__ = ()
     entity_type = BINARY_SENSOR
 
-    def __init__(self, name, attr, device_class=None, entity_category=None, field=None, invert=False,
-                 source=None) -> None:
-        super().__init__(name, attr, device_class, entity_category, field, source)
-        self.invert = invert
+    @property
+    def invert(self):
+        return self.descriptor.invert
 
     @property
     def state(self):
-        state = self._state in [1, 'enabled', True, 'Connected', 'connect']
-        return not state if self.invert else state
+        state = self._state in BINARY_ON_STATES
+        return not state if self.descriptor.invert else state
 
 
 class ApplianceButton(ApplianceEntity):
+    __slots__ = ("val_to_send", "icon")
     entity_type = BUTTON
 
-    def __init__(self, name, attr, unit=None, device_class=None, entity_category=None, source=None, val_to_send=None,
-                 icon=None) -> None:
-        super().__init__(name, attr, device_class, entity_category, None, source)
+    def __init__(self, descriptor: EntityDescriptor, name, source, val_to_send, icon=None) -> None:
         self.val_to_send = val_to_send
         self.icon = icon
+        super().__init__(descriptor, name, source)
 
     def setup(self, data: ElectroluxLibraryEntity):
         return self
 
+    def update(self, data: ElectroluxLibraryEntity) -> bool:
+        return False
+
 
 class Appliance:
     brand: str
     device: str
     entities: []
 
-    def __init__(self, name, pnc_id, brand, model) -> None:
+    def __init__(self, name, pnc_id, brand, model, serial_number=None) -> None:
         self.model = model
         self.pnc_id = pnc_id
         self.name = name
         self.brand = brand
+        self.serial_number = serial_number
+        self.entities = []
+        self._entity_index = {}
+        self.data = None
+        self.changed = set()
+        self.failures = 0
+        self._catalogue_key = None
+        # Translated ApplianceState text of the codes the appliance reported, in the account language
+        self._state_texts = {}
+
+    @property
+    def reachable(self) -> bool:
+        """Return false once the last polls of the appliance failed too many times in a row."""
+        return self.failures < UNAVAILABLE_AFTER_FAILURES
+
+    @property
+    def connected(self) -> bool:
+        entity = self.get_entity(BINARY_SENSOR, 'status', 'APL', None)
+        return entity is None or entity.state
+
+    @property
+    def available(self) -> bool:
+        return self.reachable and self.connected
+
+    def appliance_state(self, source):
+        """Return the ApplianceState code of the source, or of the appliance if the source has none."""
+        state = self.state_code(source)
+        if state is None:
+            entity = next((entity for entity in self.entities if entity.attr == "ApplianceState"), None)
+            if entity is not None:
+                state = self.state_code(entity.source)
+        return state
+
+    def state_code(self, source):
+        """Return the ApplianceState numberValue of the source, which unlike its text is the same in every language."""
+        if self.data is None:
+            return None
+        return self.data.get_from_states("ApplianceState", "numberValue", source)
 
     def get_entity(self, entity_type, entity_attr, entity_source, val_to_send):
-        return next(
-            entity
-            for entity in self.entities
-            if
-            entity.attr == entity_attr and entity.entity_type == entity_type and entity.source == entity_source and entity.val_to_send == val_to_send
-        )
+        return self._entity_index.get((entity_type, entity_attr, entity_source, val_to_send))
 
     def setup(self, data: ElectroluxLibraryEntity):
+        appliance_name = data.get_name()
         entities = [
-            ApplianceBinary(
-                name=data.get_name(),
-                attr='status',
-                device_class=BinarySensorDeviceClass.CONNECTIVITY,
-                entity_category=EntityCategory.DIAGNOSTIC,
-                source='APL',
-            ),
+            ApplianceBinary(STATUS_DESCRIPTOR, appliance_name, 'APL'),
+            ApplianceSensor(SSID_DESCRIPTOR, f"{appliance_name} SSID", 'NIU'),
             ApplianceSensor(
-                name=f"{data.get_name()} SSID",
-                attr='Ssid',
-                entity_category=EntityCategory.DIAGNOSTIC,
-                source='NIU',
-            ),
-            ApplianceSensor(
-                name=f"{data.get_name()} {data.get_sensor_name('LinkQualityIndicator', 'NIU')}",
-                attr='LinkQualityIndicator',
-                field = 'numberValue',
-                device_class=SensorDeviceClass.SIGNAL_STRENGTH,
-                entity_category=EntityCategory.DIAGNOSTIC,
-                source='NIU',
+                LINK_QUALITY_DESCRIPTOR,
+                f"{appliance_name} {data.get_sensor_name('LinkQualityIndicator', 'NIU')}",
+                'NIU',
             ),
         ]
         sources = data.sources_list()
         for src in sources:
-            for sensorType, sensors_list in sensors.items():
-                for sensorName, params in sensors_list.items():
-                    entities.append(
-                        ApplianceSensor(
-                            name=f"{data.get_name()} {data.get_sensor_name(sensorName, src)}{data.get_suffix(sensorName, src)}",
-                            attr=sensorName,
-                            field=params[0],
-                            device_class=params[1],
-                            entity_category = sensorType,
-                            unit=params[2],
-                            source=src,
-                        )
-                )
-            for sensorType, sensors_list in sensors_binary.items():
-                for sensorName, params in sensors_list.items():
-                    entities.append(
-                        ApplianceBinary(
-                            name=f"{data.get_name()} {data.get_sensor_name(sensorName, src)}{data.get_suffix(sensorName, src)}",
-                            attr=sensorName,
-                            field=params[0],
-                            device_class=params[1],
-                            entity_category = sensorType,
-                            invert=params[2],
-                            source=src,
-                        )
-                )
+            for descriptor in descriptors_for(data.names(src)):
+                name = f"{appliance_name} {data.get_sensor_name(descriptor.attr, src)}{data.get_suffix(descriptor.attr, src)}"
+                if descriptor.entity_type != SENSOR:
+                    entity_class = ApplianceBinary
+                elif descriptor.attr in interpolated_time_sensors:
+                    entity_class = ApplianceTimeSensor
+                else:
+                    entity_class = ApplianceSensor
+                entities.append(entity_class(descriptor, name, src))
 
+            suffix = data.get_suffix('ExecuteCommand', src)
             for key, command in data.commands_list(src).items():
                 entities.append(
                     ApplianceButton(
-                        name=f"{data.get_name()} {data.get_command_name(command)}{data.get_suffix('ExecuteCommand', src)}",
-                        attr='ExecuteCommand',
+                        COMMAND_DESCRIPTOR,
+                        f"{appliance_name} {data.get_command_name(command)}{suffix}",
+                        src,
                         val_to_send=key,
-                        source=src,
                         icon=icon_mapping.get(key, "mdi:gesture-tap-button"),
                     )
                 )
@@ -283,11 +374,83 @@ class Appliance:
             entity.setup(data)
             for entity in entities if data.value_exists(entity.attr, entity.source)
         ]
+        self._entity_index = {}
+        for entity in self.entities:
+            self._entity_index.setdefault(entity.key, entity)
+        self.data = data
+        self._catalogue_key = data.catalogue_key()
+        self.changed = {entity.key for entity in self.entities}
+        self._remember_state_texts()
+
+    def _remember_state_texts(self):
+        for key in self.changed:
+            if key[0] == SENSOR and key[1] == "ApplianceState":
+                entity = self._entity_index[key]
+                code = self.state_code(entity.source)
+                if code is not None and isinstance(entity.state, str):
+                    self._state_texts[code] = entity.state
+
+    def set_optimistic_state(self, source, command) -> set:
+        """Show the ApplianceState a command is expected to lead to, return the keys of the replaced states.
+
+        Nothing is shown until the appliance reported that state once, its text depends on the language.
+        """
+        state = self._state_texts.get(command_optimistic_states.get(command))
+        entity = self.get_entity(SENSOR, "ApplianceState", source, None)
+        if state is None or entity is None:
+            return set()
+        entity._state = state
+        return {entity.key}
+
+    def restore_states(self, keys) -> set:
+        """Show the last received states of the entities again, return the keys whose state changed.
+
+        The states come from the last payload, not from before the press: a second press of a
+        pending command would only remember the optimistic state of the first one.
+        """
+        if self.data is None:
+            return set()
+        return {key for key in keys if key in self._entity_index and self._entity_index[key].update(self.data)}
+
+    def catalogue_changed(self, data: ElectroluxLibraryEntity) -> bool:
+        if self.data is None or data.catalogue_key() != self._catalogue_key:
+            return True
+        return data.profile is not self.data.profile and data.profile != self.data.profile
+
+    def update(self, data: ElectroluxLibraryEntity, names=None):
+        """Refresh entity states in place, rebuilding the entities only when the catalogue changed.
+
+        When ``names`` is given only the entities of these attributes are evaluated again.
+        Returns the keys of the entities whose state changed.
+        """
+        if self.catalogue_changed(data):
+            _LOGGER.debug("Entity catalogue of appliance %s changed, rebuilding it", self.pnc_id)
+            self.setup(data)
+            return self.changed
+        self.data = data
+        entities = self.entities if names is None else [entity for entity in self.entities if entity.attr in names]
+        self.changed = {entity.key for entity in entities if entity.update(data)}
+        self._remember_state_texts()
+        return self.changed
 
 
 class Appliances:
+    """Registry of the account appliances, keyed by PNC id and indexed by name and serial number."""
+
     def __init__(self, found_appliances) -> None:
         self.found_appliances = found_appliances
+        self._by_name = {}
+        self._by_serial = {}
+        for appliance in found_appliances.values():
+            self._by_name.setdefault(appliance.name, appliance)
+            if appliance.serial_number:
+                self._by_serial.setdefault(appliance.serial_number, appliance)
 
     def get_appliance(self, pnc_id):
         return self.found_appliances.get(pnc_id, None)
+
+    def get_appliance_by_name(self, name):
+        return self._by_name.get(name, None)
+
+    def get_appliance_by_serial(self, serial_number):
+        return self._by_serial.get(serial_number, None)
@@ -0,0 +1,60 @@
+"""Per appliance coordinator for Electrolux Status."""
+import logging
+from datetime import timedelta
+
+from homeassistant.core import HomeAssistant, callback
+from homeassistant.helpers.debounce import Debouncer
+from homeassistant.helpers.update_coordinator import DataUpdateCoordinator
+
+from .api import Appliance
+from .const import COMMAND_REFRESH_DELAY, DOMAIN
+
+_LOGGER: logging.Logger = logging.getLogger(__package__)
+
+
+class ElectroluxApplianceCoordinator(DataUpdateCoordinator):
+    """Own the state of a single appliance, refreshed on its own schedule.
+
+    The account coordinator discovers the appliances and does the cloud calls, this
+    coordinator only decides when its appliance is polled and notifies its entities.
+    """
+
+    def __init__(self, hass: HomeAssistant, account, pnc_id, appliance: Appliance = None) -> None:
+        """Initialize."""
+        self.account = account
+        self.pnc_id = pnc_id
+        super().__init__(
+            hass, _LOGGER, name=f"{DOMAIN} {pnc_id}", update_interval=account.scheduler.idle_interval,
+            # Merges the refreshes requested right after commands
+            request_refresh_debouncer=Debouncer(hass, _LOGGER, cooldown=COMMAND_REFRESH_DELAY, immediate=False),
+        )
+        if appliance is not None:
+            self.data = appliance
+
+    async def _async_update_data(self) -> Appliance:
+        try:
+            return await self.account.async_update_appliance(self.pnc_id)
+        finally:
+            self.update_interval = None if self.account.polling_paused else self.account.scheduler.interval(self.pnc_id)
+
+    @callback
+    def async_set_update_interval(self, update_interval: timedelta) -> None:
+        """Change the polling interval of the running coordinator, None pauses polling."""
+        self.update_interval = update_interval
+        if self._listeners:
+            self._schedule_refresh()
+
+    @callback
+    def async_update_listeners(self) -> None:
+        with self.account.metrics.timer("dispatch"):
+            super().async_update_listeners()
+
+    @callback
+    def async_stop(self) -> None:
+        """Stop polling, the entities of a removed appliance become unavailable."""
+        self.update_interval = None
+        if self._unsub_refresh:
+            self._unsub_refresh()
+            self._unsub_refresh = None
+        self.last_update_success = False
+        self.async_update_listeners()
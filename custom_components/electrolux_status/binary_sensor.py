@@ -24,6 +24,14 @@ async def async_setup_entry(hass, entry, async_add_devices):
 class ElectroluxBinarySensor(ElectroluxStatusEntity, BinarySensorEntity):
     """Electrolux Status binary_sensor class."""
 
+    @property
+    def extra_state_attributes(self):
+        """Return the state attributes, with the poll schedule on the connectivity sensor."""
+        attributes = super().extra_state_attributes
+        if self.entity_attr == "status":
+            attributes.update(self.account.scheduler.attributes(self.pnc_id))
+        return attributes
+
     @property
     def is_on(self):
         """Return true if the binary_sensor is on."""
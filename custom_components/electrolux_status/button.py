@@ -26,5 +26,15 @@ class ElectroluxButton(ElectroluxButtonEntity, ButtonEntity):
 
     async def async_press(self) -> None:
         if self.entity_attr == "ExecuteCommand":
-            await self.hass.async_add_executor_job(self.coordinator.api.setHacl, self.get_appliance.pnc_id, "0x0403", self.val_to_send, self.entity_source)
+            appliance = self.get_appliance
+            optimistic = appliance.set_optimistic_state(self.entity_source, self.val_to_send)
+            self.account.async_publish(appliance, optimistic)
+            try:
+                await self.account.commands.async_submit(appliance.pnc_id, "0x0403", self.val_to_send, self.entity_source)
+            except Exception:
+                # Command rejected, show the received state again and check what the appliance does now
+                self.account.async_publish(appliance, appliance.restore_states(optimistic))
+                await self.account.async_request_appliance_refresh(appliance.pnc_id)
+                raise
+            await self.account.async_request_appliance_refresh(appliance.pnc_id)
 
@@ -0,0 +1,60 @@
+"""Sensor catalogue compiled once from the const.py tables."""
+from homeassistant.components.binary_sensor import BinarySensorDeviceClass
+from homeassistant.components.sensor import SensorDeviceClass
+from homeassistant.helpers.entity import EntityCategory
+
+from .const import BINARY_SENSOR, BUTTON, SENSOR
+from .const import sensors, sensors_binary
+
+
+class EntityDescriptor:
+    """Static, immutable description of an appliance entity, shared by every appliance."""
+
+    __slots__ = ("attr", "entity_type", "field", "device_class", "unit", "entity_category", "invert", "position")
+
+    def __init__(self, attr, entity_type, field, device_class, entity_category, unit=None, invert=None,
+                 position=0) -> None:
+        for slot, value in zip(self.__slots__, (attr, entity_type, field, device_class, unit, entity_category,
+                                                invert, position)):
+            object.__setattr__(self, slot, value)
+
+    def __setattr__(self, name, value):
+        raise AttributeError(f"{type(self).__name__} is immutable")
+
+    def __delattr__(self, name):
+        raise AttributeError(f"{type(self).__name__} is immutable")
+
+
+def _compile_catalogue():
+    descriptors = []
+    for category, sensors_list in sensors.items():
+        for attr, params in sensors_list.items():
+            descriptors.append(EntityDescriptor(attr, SENSOR, params[0], params[1], category, unit=params[2],
+                                                position=len(descriptors)))
+    for category, sensors_list in sensors_binary.items():
+        for attr, params in sensors_list.items():
+            descriptors.append(EntityDescriptor(attr, BINARY_SENSOR, params[0], params[1], category, invert=params[2],
+                                                position=len(descriptors)))
+    catalogue = {}
+    for descriptor in descriptors:
+        catalogue.setdefault(descriptor.attr, []).append(descriptor)
+    return {attr: tuple(attr_descriptors) for attr, attr_descriptors in catalogue.items()}
+
+
+# Entities every appliance gets, whatever its profile
+STATUS_DESCRIPTOR = EntityDescriptor('status', BINARY_SENSOR, None, BinarySensorDeviceClass.CONNECTIVITY,
+                                     EntityCategory.DIAGNOSTIC, invert=False)
+SSID_DESCRIPTOR = EntityDescriptor('Ssid', SENSOR, None, None, EntityCategory.DIAGNOSTIC)
+LINK_QUALITY_DESCRIPTOR = EntityDescriptor('LinkQualityIndicator', SENSOR, 'numberValue',
+                                           SensorDeviceClass.SIGNAL_STRENGTH, EntityCategory.DIAGNOSTIC)
+COMMAND_DESCRIPTOR = EntityDescriptor('ExecuteCommand', BUTTON, None, None, None)
+
+# Attribute name -> descriptors, in the order of the const.py tables
+CATALOGUE = _compile_catalogue()
+
+
+def descriptors_for(names):
+    """Return the descriptors of the catalogued attributes among ``names``, in catalogue order."""
+    found = [descriptor for attr in CATALOGUE.keys() & names for descriptor in CATALOGUE[attr]]
+    found.sort(key=lambda descriptor: descriptor.position)
+    return found
@@ -0,0 +1,109 @@
+"""Appliance command queue for Electrolux Status."""
+import asyncio
+import logging
+import time
+
+from homeassistant.core import HomeAssistant
+
+from .const import COMMAND_RATE, COMMAND_BURST
+from .metrics import CoordinatorMetrics
+from .session import ElectroluxSessionManager
+
+_LOGGER: logging.Logger = logging.getLogger(__package__)
+
+
+class TokenBucket:
+    """Allow ``rate`` operations per second on average, with bursts of up to ``capacity``."""
+
+    def __init__(self, rate: float, capacity: int) -> None:
+        """Initialize."""
+        self.rate = rate
+        self.capacity = capacity
+        self._tokens = float(capacity)
+        self._updated = time.monotonic()
+
+    async def async_acquire(self):
+        while True:
+            now = time.monotonic()
+            self._tokens = min(self.capacity, self._tokens + (now - self._updated) * self.rate)
+            self._updated = now
+            if self._tokens >= 1:
+                self._tokens -= 1
+                return
+            await asyncio.sleep((1 - self._tokens) / self.rate)
+
+
+class ElectroluxCommandQueue:
+    """Send setHacl commands one at a time per appliance, appliances in parallel.
+
+    A command that is already waiting in the queue is not queued again, the caller gets the
+    pending result instead. All appliances share one token bucket rate limit.
+    """
+
+    def __init__(self, hass: HomeAssistant, session: ElectroluxSessionManager, metrics: CoordinatorMetrics,
+                 rate: float = COMMAND_RATE, burst: int = COMMAND_BURST) -> None:
+        """Initialize."""
+        self.hass = hass
+        self.session = session
+        self.metrics = metrics
+        self.bucket = TokenBucket(rate, burst)
+        self.deduplicated = 0
+        self._queues = {}
+        self._workers = {}
+        self._pending = {}
+        self._in_flight = 0
+
+    @property
+    def depth(self) -> int:
+        """Return the number of queued and in flight commands."""
+        return sum(queue.qsize() for queue in self._queues.values()) + self._in_flight
+
+    def async_submit(self, pnc_id, hacl, value, destination) -> asyncio.Future:
+        """Queue a command, return a future resolved once the cloud accepted or rejected it."""
+        command = (pnc_id, hacl, value, destination)
+        if command in self._pending:
+            self.deduplicated += 1
+            return self._pending[command]
+        future = self.hass.loop.create_future()
+        self._pending[command] = future
+        if pnc_id not in self._queues:
+            self._queues[pnc_id] = asyncio.Queue()
+            self._workers[pnc_id] = self.hass.loop.create_task(self._async_worker(self._queues[pnc_id]))
+        self._queues[pnc_id].put_nowait((command, future, time.perf_counter()))
+        return future
+
+    async def _async_worker(self, queue: asyncio.Queue):
+        while True:
+            command, future, queued = await queue.get()
+            self._in_flight += 1
+            error = False
+            try:
+                await self.bucket.async_acquire()
+                # From here on a new press is a new command
+                self._pending.pop(command, None)
+                await self.session.async_call(self.session.api.setHacl, *command)
+            except asyncio.CancelledError:
+                future.cancel()
+                raise
+            except Exception as ex:  # pylint: disable=broad-except
+                error = True
+                _LOGGER.warning("Command %s to appliance %s failed: %s", command[2], command[0], ex)
+                if not future.done():
+                    future.set_exception(ex)
+            else:
+                if not future.done():
+                    future.set_result(None)
+            finally:
+                self._pending.pop(command, None)
+                self._in_flight -= 1
+                self.metrics.phase("command").record(time.perf_counter() - queued, error)
+
+    async def async_stop(self):
+        for worker in self._workers.values():
+            worker.cancel()
+        await asyncio.gather(*self._workers.values(), return_exceptions=True)
+        for future in self._pending.values():
+            future.cancel()
+        self._queues.clear()
+        self._workers.clear()
+        self._pending.clear()
@@ -1,5 +1,6 @@
 """Adds config flow for Electrolux Status."""
 import logging
+import time
 
 import homeassistant.helpers.config_validation as cv
 from homeassistant.helpers.selector import selector
@@ -8,8 +9,11 @@ from homeassistant import config_entries
 from homeassistant.core import callback
 
 from .pyelectroluxconnect_util import pyelectroluxconnect_util
+from .handoff import HandedOffSession, account_key, get_session_handoff
 from .const import CONF_PASSWORD, CONF_SCAN_INTERVAL, DEFAULT_SCAN_INTERVAL, CONF_REGION
-from .const import CONF_LANGUAGE, DEFAULT_LANGUAGE
+from .const import CONF_MAX_CONCURRENCY, DEFAULT_MAX_CONCURRENCY
+from .const import CONF_STREAM_URL, CONF_DIAGNOSTIC_SENSORS
+from .const import CONF_LANGUAGE, DEFAULT_LANGUAGE, DEFAULT_TOKEN_LIFETIME
 from .const import CONF_USERNAME
 from .const import DOMAIN
 from .const import languages
@@ -26,6 +30,7 @@ class ElectroluxStatusFlowHandler(config_entries.ConfigFlow, domain=DOMAIN):
     def __init__(self):
         """Initialize."""
         self._errors = {}
+        self._reauth_entry = None
 
     async def async_step_user(self, user_input=None):
         """Handle a flow initialized by the user."""
@@ -36,11 +41,7 @@ class ElectroluxStatusFlowHandler(config_entries.ConfigFlow, domain=DOMAIN):
         #     return self.async_abort(reason="single_instance_allowed")
 
         if user_input is not None:
-            valid = await self._test_credentials(
-                user_input[CONF_USERNAME],
-                user_input[CONF_PASSWORD],
-                user_input[CONF_REGION],
-            )
+            valid = await self._test_credentials(user_input)
             if valid:
                 return self.async_create_entry(
                     title=user_input[CONF_USERNAME], data=user_input
@@ -52,6 +53,38 @@ class ElectroluxStatusFlowHandler(config_entries.ConfigFlow, domain=DOMAIN):
 
         return await self._show_config_form(user_input)
 
+    async def async_step_reauth(self, entry_data):
+        """Handle the cloud rejecting the password of an entry."""
+        self._reauth_entry = self.hass.config_entries.async_get_entry(self.context["entry_id"])
+        return await self.async_step_reauth_confirm()
+
+    async def async_step_reauth_confirm(self, user_input=None):
+        """Ask for the new password."""
+        self._errors = {}
+        if user_input is not None:
+            data = {**self._reauth_entry.data, CONF_PASSWORD: user_input[CONF_PASSWORD]}
+            if await self._test_credentials(data):
+                # The entries of the account share one coordinator, all of them start again with the new password
+                key = account_key(data)
+                entries = [entry for entry in self._async_current_entries() if account_key(entry.data) == key]
+                for entry in entries:
+                    self.hass.config_entries.async_update_entry(
+                        entry, data={**entry.data, CONF_PASSWORD: user_input[CONF_PASSWORD]}
+                    )
+                for entry in entries:
+                    await self.hass.config_entries.async_unload(entry.entry_id)
+                for entry in entries:
+                    await self.hass.config_entries.async_setup(entry.entry_id)
+                return self.async_abort(reason="reauth_successful")
+            self._errors["base"] = "auth"
+
+        return self.async_show_form(
+            step_id="reauth_confirm",
+            data_schema=vol.Schema({vol.Required(CONF_PASSWORD): str}),
+            description_placeholders={"username": self._reauth_entry.data[CONF_USERNAME]},
+            errors=self._errors,
+        )
+
     @staticmethod
     @callback
     def async_get_options_flow(config_entry):
@@ -95,15 +128,29 @@ class ElectroluxStatusFlowHandler(config_entries.ConfigFlow, domain=DOMAIN):
             errors=self._errors,
         )
 
-    async def _test_credentials(self, username, password, region):
+    async def _test_credentials(self, user_input):
         """Return true if credentials is valid."""
         try:
-            client = pyelectroluxconnect_util.get_session(username, password, region)
+            client = pyelectroluxconnect_util.get_session(
+                user_input[CONF_USERNAME],
+                user_input[CONF_PASSWORD],
+                user_input[CONF_REGION],
+                languages.get(user_input.get(CONF_LANGUAGE, DEFAULT_LANGUAGE), "eng"),
+            )
             await self.hass.async_add_executor_job(client.login)
-            return True
+            token_expires = time.monotonic() + DEFAULT_TOKEN_LIFETIME
         except Exception as inst:  # pylint: disable=broad-except
             _LOGGER.exception(inst)
-        return False
+            return False
+        try:
+            appliances_json = await self.hass.async_add_executor_job(client.getAppliances)
+        except Exception as inst:  # pylint: disable=broad-except
+            _LOGGER.debug("Could not prefetch the appliance list: %s", inst)
+            appliances_json = None
+        # The entry setup that follows starts with this client
+        get_session_handoff(self.hass).put(account_key(user_input),
+                                           HandedOffSession(client, token_expires, appliances_json))
+        return True
 
 
 class ElectroluxStatusOptionsFlowHandler(config_entries.OptionsFlow):
@@ -134,6 +181,20 @@ class ElectroluxStatusOptionsFlowHandler(config_entries.OptionsFlow):
                             CONF_SCAN_INTERVAL, DEFAULT_SCAN_INTERVAL
                         ),
                     ): cv.positive_int,
+                    vol.Optional(
+                        CONF_MAX_CONCURRENCY,
+                        default=self.config_entry.options.get(
+                            CONF_MAX_CONCURRENCY, DEFAULT_MAX_CONCURRENCY
+                        ),
+                    ): cv.positive_int,
+                    vol.Optional(
+                        CONF_STREAM_URL,
+                        default=self.config_entry.options.get(CONF_STREAM_URL, ""),
+                    ): str,
+                    vol.Optional(
+                        CONF_DIAGNOSTIC_SENSORS,
+                        default=self.config_entry.options.get(CONF_DIAGNOSTIC_SENSORS, False),
+                    ): bool,
                 }
             ),
         )
@@ -1,5 +1,5 @@
 """The electrolux Status constants."""
-from homeassistant.const import TIME_MINUTES, TEMP_CELSIUS, PERCENTAGE
+from homeassistant.const import TIME_MINUTES, TIME_MILLISECONDS, TEMP_CELSIUS, PERCENTAGE
 
 from homeassistant.components.sensor import SensorDeviceClass
 from homeassistant.components.binary_sensor import BinarySensorDeviceClass
@@ -22,6 +22,12 @@ SENSOR = "sensor"
 BUTTON = "button"
 PLATFORMS = [BINARY_SENSOR, SENSOR, BUTTON]
 
+# Services
+SERVICE_REFRESH_PROFILES = "refresh_profiles"
+
+# Dispatcher signal sent with the new options of a config entry, format with the entry id
+SIGNAL_OPTIONS_UPDATED = f"{DOMAIN}_options_updated_{{}}"
+
 # Configuration and options
 CONF_ENABLED = "enabled"
 CONF_USERNAME = "username"
@@ -29,10 +35,42 @@ CONF_PASSWORD = "password"
 CONF_REGION = "region"
 CONF_LANGUAGE = "language"
 CONF_SCAN_INTERVAL = "scan_interval"
+CONF_MAX_CONCURRENCY = "max_concurrency"
+CONF_STREAM_URL = "stream_url"
+CONF_DIAGNOSTIC_SENSORS = "diagnostic_sensors"
 
 # Defaults
 DEFAULT_NAME = DOMAIN
 DEFAULT_SCAN_INTERVAL = 30
+DEFAULT_MAX_CONCURRENCY = 4
+# Timeout (seconds) of a single cloud call, not counting the wait for the concurrency limit
+DEFAULT_CALL_TIMEOUT = 30
+# Adaptive polling: running appliances, and the ones at most ACTIVE_TIME_TO_END minutes from
+# their end or delayed start, are polled at most every ACTIVE_SCAN_INTERVAL seconds,
+# switched off or disconnected ones OFF_SCAN_FACTOR times less often than the scan interval
+ACTIVE_SCAN_INTERVAL = 10
+ACTIVE_TIME_TO_END = 5
+OFF_SCAN_FACTOR = 5
+MAX_SCAN_INTERVAL = 900
+# Consecutive failed polls after which the last known state of an appliance is shown as unavailable
+UNAVAILABLE_AFTER_FAILURES = 3
+# Assumed session token lifetime (seconds); a rejected token triggers a new login earlier
+DEFAULT_TOKEN_LIFETIME = 3600
+# Logged in sessions left by the config flow or an unload are reused by a setup within this many seconds
+SESSION_HANDOFF_TTL = 300
+# Push stream heartbeat and reconnect delays (seconds)
+STREAM_HEARTBEAT = 30
+STREAM_RECONNECT_MIN = 5
+STREAM_RECONNECT_MAX = 300
+# Delay (seconds) before the state of an appliance is fetched after a command
+COMMAND_REFRESH_DELAY = 2
+# Appliance commands: average rate (per second) and burst allowed across all appliances
+COMMAND_RATE = 1
+COMMAND_BURST = 3
+# Number of samples kept per refresh phase for the timing percentiles
+METRICS_WINDOW = 200
+# Cached appliance profiles are fetched again after a week
+DEFAULT_PROFILE_TTL = 7 * 24 * 3600
 DEFAULT_REGION = "emea"
 DEFAULT_LANGUAGE = "English"
 
@@ -123,6 +161,45 @@ sensors_binary_config = {
 
 }
 
+# ApplianceState numberValue codes used by the adaptive polling, the same in every language
+# (0 off, 1 idle, 2 running, 3 paused, 4 end of cycle, 5 delayed start). End of cycle and
+# delayed start can last hours, they are only polled faster when TimeToEnd or StartTime nears zero.
+RUNNING_STATES = [2]
+OFF_STATES = [0]
+
+interpolated_time_sensors = {
+# Time sensors extrapolated between polls
+# Sensor Name: [minutes added per elapsed minute, ApplianceState codes the time moves in]
+    "TimeToEnd": [-1, [2]],
+    "DryingTime": [-1, [2]],
+    "RunningTime": [1, [2]],
+    "StartTime": [-1, [5]],
+}
+# Seconds between two checks of the extrapolated time sensors
+INTERPOLATION_INTERVAL = 15
+
+diagnostic_sensors = {
+# Key: [name, unit]
+    "refresh_p50": ["refresh time p50", TIME_MILLISECONDS],
+    "refresh_p95": ["refresh time p95", TIME_MILLISECONDS],
+    "refresh_max": ["refresh time max", TIME_MILLISECONDS],
+    "cloud_calls": ["cloud calls", None],
+    "cloud_errors": ["cloud errors", None],
+    "logins": ["logins", None],
+    "suppressed_writes": ["suppressed state writes", None],
+    "command_queue_depth": ["command queue depth", None],
+    "command_latency_p95": ["command latency p95", TIME_MILLISECONDS],
+}
+
+# ApplianceState code shown right after a command is sent, until the appliance state is fetched again
+command_optimistic_states = {
+    "0": 0,
+    "2": 2,
+    "3": 1,
+    "4": 3,
+    "5": 2,
+}
+
 icon_mapping = {
     "0": "mdi:power-off",
     "1": "mdi:power-on",
@@ -0,0 +1,53 @@
+"""Diagnostics support for Electrolux Status."""
+from homeassistant.components.diagnostics import async_redact_data
+from homeassistant.config_entries import ConfigEntry
+from homeassistant.core import HomeAssistant
+
+from .const import CONF_PASSWORD, CONF_USERNAME, CONF_STREAM_URL
+from .const import DOMAIN
+
+TO_REDACT = {CONF_USERNAME, CONF_PASSWORD, CONF_STREAM_URL}
+
+
+async def async_get_config_entry_diagnostics(hass: HomeAssistant, entry: ConfigEntry) -> dict:
+    """Return diagnostics for a config entry."""
+    coordinator = hass.data[DOMAIN][entry.entry_id]
+    appliances = coordinator.data["appliances"].found_appliances if coordinator.data else {}
+    return {
+        "entry": {
+            "data": async_redact_data(dict(entry.data), TO_REDACT),
+            "options": async_redact_data(dict(entry.options), TO_REDACT),
+        },
+        "metrics": coordinator.metrics.as_dict(),
+        "session": {
+            "logins": coordinator.session.logins,
+            "reauthentications": coordinator.session.reauthentications,
+        },
+        "suppressed_writes": coordinator.suppressed_writes,
+        "command_queue": {
+            "depth": coordinator.commands.depth,
+            "deduplicated": coordinator.commands.deduplicated,
+        },
+        "payload_fingerprints": {
+            "unchanged": coordinator.fingerprint_hits,
+            "partial": coordinator.fingerprint_partial,
+            "changed": coordinator.fingerprint_misses,
+        },
+        "profile_cache": {
+            "hits": coordinator.profile_cache.hits,
+            "misses": coordinator.profile_cache.misses,
+        },
+        "stream": {
+            "connected": coordinator.stream.connected,
+            "messages": coordinator.stream.messages,
+        } if coordinator.stream is not None else None,
+        "appliances": {
+            pnc_id: {
+                "model": appliance.model,
+                "entities": len(appliance.entities),
+                "available": appliance.available,
+                **coordinator.scheduler.attributes(pnc_id),
+            }
+            for pnc_id, appliance in appliances.items()
+        },
+    }
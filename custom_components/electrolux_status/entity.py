@@ -1,4 +1,5 @@
 from homeassistant.components.sensor import ENTITY_ID_FORMAT
+from homeassistant.core import callback
 from homeassistant.helpers.update_coordinator import CoordinatorEntity
 from homeassistant.helpers.entity import Entity
 from . import ElectroluxStatusDataUpdateCoordinator
@@ -9,27 +10,53 @@ from .const import DOMAIN
 
 class ElectroluxStatusEntity(CoordinatorEntity):
     def __init__(self, coordinator: ElectroluxStatusDataUpdateCoordinator, config_entry, pnc_id, entity_type, entity_attr, entity_source):
-        super().__init__(coordinator)
+        # Subscribe to the coordinator of this appliance only
+        super().__init__(coordinator.appliance_coordinators[pnc_id])
+        self.account = coordinator
         self.api = coordinator.api
         self.entity_attr = entity_attr
         self.entity_type = entity_type
         self.entity_source = entity_source
         self.config_entry = config_entry
         self.pnc_id = pnc_id
+        self.entity_key = (entity_type, entity_attr, entity_source, None)
+        self._entity = None
+        self._last_written = None
         self.entity_id = ENTITY_ID_FORMAT.format(f"{self.get_appliance.brand}_{self.get_appliance.name}_{self.entity_source}_{self.entity_attr}")
 
+    @callback
+    def _handle_coordinator_update(self) -> None:
+        """Write the state only when the value, availability or attributes of this entity changed."""
+        self._entity = None
+        snapshot = (self.available, self.extra_state_attributes)
+        if snapshot == self._last_written and self.entity_key not in self.get_appliance.changed:
+            self.account.suppressed_writes += 1
+            return
+        self._last_written = snapshot
+        super()._handle_coordinator_update()
+
     @property
     def name(self):
         """Return the name of the sensor."""
         return self.get_entity.name
 
+    @property
+    def available(self) -> bool:
+        """Return false if the appliance could not be polled or, except for its connectivity, is disconnected."""
+        appliance = self.get_appliance
+        if not super().available or appliance is None:
+            return False
+        return appliance.reachable if self.entity_attr == "status" else appliance.available
+
     @property
     def get_entity(self) -> ApplianceEntity:
-        return self.get_appliance.get_entity(self.entity_type, self.entity_attr, self.entity_source, None)
+        if self._entity is None:
+            self._entity = self.get_appliance.get_entity(*self.entity_key)
+        return self._entity
 
     @property
     def get_appliance(self) -> Appliance:
-        return self.coordinator.data['appliances'].get_appliance(self.pnc_id)
+        return self.coordinator.data
 
     @property
     def unique_id(self):
@@ -39,7 +66,7 @@ class ElectroluxStatusEntity(CoordinatorEntity):
     @property
     def device_info(self):
         return {
-            "identifiers": {(DOMAIN, self.get_appliance.name)},
+            "identifiers": {(DOMAIN, self.pnc_id)},
             "name": self.get_appliance.name,
             "model": self.get_appliance.model,
             "manufacturer": self.get_appliance.brand,
@@ -65,7 +92,8 @@ class ElectroluxStatusEntity(CoordinatorEntity):
 
 class ElectroluxButtonEntity(Entity):
     def __init__(self, coordinator, config_entry, pnc_id, entity_type, entity_attr, entity_source, val_to_send, icon):
-        self.coordinator = coordinator
+        self.coordinator = coordinator.appliance_coordinators[pnc_id]
+        self.account = coordinator
         self.entity_attr = entity_attr
         self.entity_type = entity_type
         self.entity_source = entity_source
@@ -73,6 +101,9 @@ class ElectroluxButtonEntity(Entity):
         self.pnc_id = pnc_id
         self.val_to_send = val_to_send
         self.button_icon = icon
+        self.entity_key = (entity_type, entity_attr, entity_source, val_to_send)
+        self._entity = None
+        self._last_available = None
         self.entity_id = ENTITY_ID_FORMAT.format(f"{self.get_appliance.brand}_{self.get_appliance.name}_{self.entity_source}_{self.entity_attr}_{self.val_to_send}")
 
     @property
@@ -80,13 +111,28 @@ class ElectroluxButtonEntity(Entity):
         """Return the name of the button."""
         return self.get_entity.name
 
+    async def async_added_to_hass(self) -> None:
+        await super().async_added_to_hass()
+        self.async_on_remove(self.coordinator.async_add_listener(self._handle_coordinator_update))
+
+    @callback
+    def _handle_coordinator_update(self) -> None:
+        # Rebind the appliance entity lazily, the catalogue may have been rebuilt
+        self._entity = None
+        available = self.available
+        if available != self._last_available:
+            self._last_available = available
+            self.async_write_ha_state()
+
     @property
     def get_entity(self) -> ApplianceEntity:
-        return self.get_appliance.get_entity(self.entity_type, self.entity_attr, self.entity_source, self.val_to_send)
+        if self._entity is None:
+            self._entity = self.get_appliance.get_entity(*self.entity_key)
+        return self._entity
 
     @property
     def get_appliance(self) -> Appliance:
-        return self.coordinator.data['appliances'].get_appliance(self.pnc_id)
+        return self.coordinator.data
 
     @property
     def unique_id(self):
@@ -96,7 +142,7 @@ class ElectroluxButtonEntity(Entity):
     @property
     def device_info(self):
         return {
-            "identifiers": {(DOMAIN, self.get_appliance.name)},
+            "identifiers": {(DOMAIN, self.pnc_id)},
             "name": self.get_appliance.name,
             "model": self.get_appliance.model,
             "manufacturer": self.get_appliance.brand,
@@ -126,5 +172,6 @@ class ElectroluxButtonEntity(Entity):
 
     @property
     def available(self):
-        #TODO: available state should depends on connect state
-        return True
+        """Return true if the last poll of the appliance worked and it is connected."""
+        appliance = self.get_appliance
+        return self.coordinator.last_update_success and appliance is not None and appliance.available
@@ -0,0 +1,51 @@
+"""Structural fingerprints of the appliance payloads for Electrolux Status."""
+
+
+def structural_hash(value) -> int:
+    """Hash a JSON like value, independently of the order of the dict keys."""
+    if isinstance(value, dict):
+        return hash(frozenset((key, structural_hash(item)) for key, item in value.items()))
+    if isinstance(value, list):
+        return hash(tuple(structural_hash(item) for item in value))
+    return hash(value)
+
+
+def state_names(state) -> set:
+    """Return the attribute names a state entry answers for, its own and its container ones."""
+    names = {state.get("name")}
+    containers = state.get("container", {})
+    for c in containers:
+        names.add(containers[c].get("name"))
+    return names
+
+
+class PayloadFingerprint:
+    """Hashes of the payloads an appliance was last built from, one per state entry."""
+
+    __slots__ = ("identity", "status", "profile", "profile_hash", "states", "state_hashes")
+
+    def __init__(self, identity, status, states, profile, previous: "PayloadFingerprint" = None) -> None:
+        self.identity = identity
+        self.status = structural_hash(status)
+        self.profile = profile
+        # Profiles usually come from the profile cache, the same object needs no hashing
+        if previous is not None and previous.profile is profile:
+            self.profile_hash = previous.profile_hash
+        else:
+            self.profile_hash = structural_hash(profile)
+        self.states = states
+        self.state_hashes = {key: structural_hash(state) for key, state in states.items()}
+
+    def changed_names(self, other: "PayloadFingerprint"):
+        """Return the attribute names whose states differ in ``other``.
+
+        An empty set means nothing changed, None that more than single states changed.
+        """
+        if (self.identity != other.identity or self.status != other.status
+                or self.profile_hash != other.profile_hash or self.state_hashes.keys() != other.state_hashes.keys()):
+            return None
+        names = set()
+        for key, state_hash in other.state_hashes.items():
+            if self.state_hashes[key] != state_hash:
+                names |= state_names(self.states[key]) | state_names(other.states[key])
+        return names
@@ -0,0 +1,64 @@
+"""Session handoff between config flow, unload and setup for Electrolux Status."""
+import logging
+import time
+
+from homeassistant.core import HomeAssistant
+
+from .const import CONF_LANGUAGE, CONF_REGION, CONF_USERNAME, DEFAULT_LANGUAGE, DEFAULT_REGION
+from .const import DOMAIN_DATA, SESSION_HANDOFF_TTL
+from .const import languages
+
+_LOGGER: logging.Logger = logging.getLogger(__package__)
+
+
+def get_session_handoff(hass: HomeAssistant) -> "SessionHandoff":
+    """Return the session handoff shared by all config entries."""
+    domain_data = hass.data.setdefault(DOMAIN_DATA, {})
+    if "session_handoff" not in domain_data:
+        domain_data["session_handoff"] = SessionHandoff()
+    return domain_data["session_handoff"]
+
+
+def account_key(data: dict) -> tuple:
+    """Return the account, region and language of config entry data."""
+    return (
+        data[CONF_USERNAME].lower(),
+        data.get(CONF_REGION, DEFAULT_REGION).lower(),
+        languages.get(data.get(CONF_LANGUAGE, DEFAULT_LANGUAGE), "eng"),
+    )
+
+
+class HandedOffSession:
+    """A logged in client, when its token expires and the appliance list it fetched."""
+
+    def __init__(self, client, token_expires: float, appliances_json=None) -> None:
+        """Initialize."""
+        self.client = client
+        self.token_expires = token_expires
+        self.appliances_json = appliances_json
+        self.stored = time.monotonic()
+
+
+class SessionHandoff:
+    """Logged in clients kept in memory for a short while, for the next setup of the same account.
+
+    The config flow and the unload of an entry leave their client here, so the setup that
+    follows does not log in and fetch the appliance list again.
+    """
+
+    def __init__(self, ttl: int = SESSION_HANDOFF_TTL) -> None:
+        """Initialize."""
+        self.ttl = ttl
+        self._sessions = {}
+
+    def put(self, key, session: HandedOffSession):
+        self._sessions[key] = session
+
+    def take(self, key):
+        """Return the session left for the account and forget it, None if there is none or it is too old."""
+        session = self._sessions.pop(key, None)
+        now = time.monotonic()
+        if session is None or now - session.stored > self.ttl or now >= session.token_expires:
+            return None
+        _LOGGER.debug("Reusing the ElectroluxStatus session of %s", key[0])
+        return session
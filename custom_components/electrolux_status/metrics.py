@@ -0,0 +1,68 @@
+"""Refresh instrumentation for Electrolux Status."""
+import time
+from collections import deque
+from contextlib import contextmanager
+
+from .const import METRICS_WINDOW
+
+
+class PhaseStats:
+    """Rolling durations, call count and error count of one refresh phase."""
+
+    def __init__(self, window: int = METRICS_WINDOW) -> None:
+        """Initialize."""
+        self.durations = deque(maxlen=window)
+        self.calls = 0
+        self.errors = 0
+
+    def record(self, duration: float, error=False):
+        self.durations.append(duration)
+        self.calls += 1
+        if error:
+            self.errors += 1
+
+    def percentile(self, percent):
+        """Return the percentile of the recorded durations in milliseconds."""
+        if not self.durations:
+            return None
+        durations = sorted(self.durations)
+        index = min(len(durations) - 1, round(percent / 100 * (len(durations) - 1)))
+        return round(durations[index] * 1000, 1)
+
+    def as_dict(self) -> dict:
+        return {
+            "calls": self.calls,
+            "errors": self.errors,
+            "p50_ms": self.percentile(50),
+            "p95_ms": self.percentile(95),
+            "max_ms": self.percentile(100),
+        }
+
+
+class CoordinatorMetrics:
+    """Per phase statistics of the coordinator refreshes."""
+
+    def __init__(self) -> None:
+        """Initialize."""
+        self.phases = {}
+
+    def phase(self, name) -> PhaseStats:
+        if name not in self.phases:
+            self.phases[name] = PhaseStats()
+        return self.phases[name]
+
+    @contextmanager
+    def timer(self, name):
+        """Time the enclosed block, counting it as an error if it raises."""
+        start = time.perf_counter()
+        error = False
+        try:
+            yield
+        except BaseException:
+            error = True
+            raise
+        finally:
+            self.phase(name).record(time.perf_counter() - start, error)
+
+    def as_dict(self) -> dict:
+        return {name: stats.as_dict() for name, stats in self.phases.items()}
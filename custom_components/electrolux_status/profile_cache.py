@@ -0,0 +1,86 @@
+"""Appliance profile cache for Electrolux Status."""
+import logging
+import time
+
+from homeassistant.core import HomeAssistant
+from homeassistant.helpers.storage import Store
+
+from .const import DOMAIN, DOMAIN_DATA, DEFAULT_PROFILE_TTL
+
+_LOGGER: logging.Logger = logging.getLogger(__package__)
+
+STORAGE_VERSION = 1
+STORAGE_KEY = f"{DOMAIN}.profiles"
+SAVE_DELAY = 10
+
+
+def get_profile_cache(hass: HomeAssistant) -> "ProfileCache":
+    """Return the profile cache shared by all config entries."""
+    domain_data = hass.data.setdefault(DOMAIN_DATA, {})
+    if "profile_cache" not in domain_data:
+        domain_data["profile_cache"] = ProfileCache(hass)
+    return domain_data["profile_cache"]
+
+
+def state_sources(appliance_state) -> list:
+    return sorted({appliance_state[k].get("source") for k in appliance_state} - {None})
+
+
+class ProfileCache:
+    """Appliance profiles kept in memory and persisted in Home Assistant storage.
+
+    An entry is used only while it is younger than the TTL, was fetched for the same
+    model/firmware fingerprint and the appliance still reports the same state sources.
+    """
+
+    def __init__(self, hass: HomeAssistant, ttl: int = DEFAULT_PROFILE_TTL) -> None:
+        """Initialize."""
+        self._store = Store(hass, STORAGE_VERSION, STORAGE_KEY)
+        self.ttl = ttl
+        self.hits = 0
+        self.misses = 0
+        self._profiles = {}
+        self._loaded = False
+
+    @staticmethod
+    def fingerprint(appliance_json) -> str:
+        return f"{appliance_json.get('model')}:{appliance_json.get('cpv')}"
+
+    async def async_load(self):
+        if self._loaded:
+            return
+        data = await self._store.async_load()
+        self._profiles = (data or {}).get("profiles", {})
+        self._loaded = True
+
+    def get(self, pnc_id, fingerprint):
+        entry = self._profiles.get(pnc_id)
+        if entry is None or entry["fingerprint"] != fingerprint or time.time() - entry["fetched"] > self.ttl:
+            self.misses += 1
+            return None
+        self.hits += 1
+        return entry["profile"]
+
+    def sources_changed(self, pnc_id, appliance_state) -> bool:
+        entry = self._profiles.get(pnc_id)
+        return entry is not None and entry["sources"] != state_sources(appliance_state)
+
+    def set(self, pnc_id, fingerprint, profile, appliance_state):
+        self._profiles[pnc_id] = {
+            "fingerprint": fingerprint,
+            "fetched": time.time(),
+            "sources": state_sources(appliance_state),
+            "profile": profile,
+        }
+        self._store.async_delay_save(self._data_to_save, SAVE_DELAY)
+
+    def invalidate(self, pnc_id=None):
+        if pnc_id is None:
+            self._profiles.clear()
+        else:
+            self._profiles.pop(pnc_id, None)
+        _LOGGER.debug("Invalidated cached profiles for %s", pnc_id or "all appliances")
+        self._store.async_delay_save(self._data_to_save, SAVE_DELAY)
+
+    def _data_to_save(self):
+        return {"profiles": self._profiles}
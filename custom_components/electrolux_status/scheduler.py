@@ -0,0 +1,102 @@
+"""Adaptive per-appliance polling for Electrolux Status."""
+from datetime import datetime, timedelta
+
+from .api import Appliance
+from .const import ACTIVE_SCAN_INTERVAL, ACTIVE_TIME_TO_END, MAX_SCAN_INTERVAL, OFF_SCAN_FACTOR
+from .const import RUNNING_STATES, OFF_STATES
+
+ACTIVITY_ACTIVE = "active"
+ACTIVITY_IDLE = "idle"
+ACTIVITY_OFF = "off"
+
+
+def appliance_activity(appliance: Appliance) -> str:
+    """Classify an appliance from its connection status, ApplianceState, TimeToEnd and StartTime entities."""
+    activity = ACTIVITY_IDLE
+    for entity in appliance.entities:
+        if entity.attr == "status" and not entity.state:
+            return ACTIVITY_OFF
+        if entity.attr == "ApplianceState":
+            state = appliance.state_code(entity.source)
+            if state in RUNNING_STATES:
+                activity = ACTIVITY_ACTIVE
+            elif state in OFF_STATES and activity != ACTIVITY_ACTIVE:
+                activity = ACTIVITY_OFF
+        if (entity.attr in ("TimeToEnd", "StartTime") and isinstance(entity.state, int)
+                and 0 < entity.state <= ACTIVE_TIME_TO_END):
+            activity = ACTIVITY_ACTIVE
+    return activity
+
+
+class AdaptivePollScheduler:
+    """Decide when each appliance is polled next.
+
+    Running appliances are polled every ``active_interval``, idle ones every scan interval
+    and switched off or disconnected ones less often. Failed polls back off exponentially.
+    """
+
+    def __init__(self, interval: timedelta) -> None:
+        """Initialize."""
+        self._next_poll = {}
+        self._intervals = {}
+        self._activity = {}
+        self._errors = {}
+        self.set_interval(interval)
+
+    def set_interval(self, interval: timedelta, now: datetime = None):
+        """Change the scan interval, the known appliances are polled next one new interval after ``now``."""
+        self.idle_interval = interval
+        self.active_interval = min(interval, timedelta(seconds=ACTIVE_SCAN_INTERVAL))
+        self.off_interval = max(interval, min(interval * OFF_SCAN_FACTOR, timedelta(seconds=MAX_SCAN_INTERVAL)))
+        for pnc_id in self._intervals:
+            if now is None:
+                self._intervals[pnc_id] = self._interval_for(pnc_id)
+            else:
+                self._schedule(pnc_id, self._interval_for(pnc_id), now)
+
+    def interval(self, pnc_id) -> timedelta:
+        """Return the delay until the next poll of the appliance."""
+        return self._intervals.get(pnc_id, self.idle_interval)
+
+    def record_success(self, pnc_id, appliance: Appliance, now: datetime):
+        self._errors.pop(pnc_id, None)
+        self._activity[pnc_id] = appliance_activity(appliance)
+        self._schedule(pnc_id, self._interval_for(pnc_id), now)
+
+    def record_failure(self, pnc_id, now: datetime) -> int:
+        """Back off the next poll of the appliance, return its number of consecutive failures."""
+        errors = self._errors[pnc_id] = self._errors.get(pnc_id, 0) + 1
+        self._schedule(pnc_id, self._interval_for(pnc_id), now)
+        return errors
+
+    def _interval_for(self, pnc_id) -> timedelta:
+        errors = self._errors.get(pnc_id)
+        if errors:
+            # Capped in seconds, the doubled timedelta itself would overflow after a few dozen failures
+            backoff = self.idle_interval.total_seconds() * 2 ** min(errors, 16)
+            return timedelta(seconds=min(backoff, MAX_SCAN_INTERVAL))
+        activity = self._activity.get(pnc_id)
+        if activity == ACTIVITY_ACTIVE:
+            return self.active_interval
+        if activity == ACTIVITY_OFF:
+            return self.off_interval
+        return self.idle_interval
+
+    def forget(self, pnc_id):
+        for schedule in (self._next_poll, self._intervals, self._activity, self._errors):
+            schedule.pop(pnc_id, None)
+
+    def _schedule(self, pnc_id, interval: timedelta, now: datetime):
+        self._intervals[pnc_id] = interval
+        self._next_poll[pnc_id] = now + interval
+
+    def attributes(self, pnc_id) -> dict:
+        """Return the poll schedule of an appliance as diagnostic attributes."""
+        if pnc_id not in self._next_poll or pnc_id not in self._intervals:
+            return {}
+        return {
+            "next_poll": self._next_poll[pnc_id].isoformat(),
+            "poll_interval": int(self._intervals[pnc_id].total_seconds()),
+            "poll_activity": self._activity.get(pnc_id),
+            "poll_errors": self._errors.get(pnc_id, 0),
+        }
@@ -1,12 +1,22 @@
+from datetime import timedelta
 from typing import cast
 
-from .api import ApplianceSensor
-from .const import DOMAIN
-from .const import SENSOR
+from .api import ApplianceSensor, ApplianceTimeSensor
+from .const import CONF_DIAGNOSTIC_SENSORS
+from .const import DOMAIN, SIGNAL_OPTIONS_UPDATED
+from .const import SENSOR, INTERPOLATION_INTERVAL
+from .const import interpolated_time_sensors
+from .const import diagnostic_sensors
 from .entity import ElectroluxStatusEntity
 
 from . import ElectroluxStatusDataUpdateCoordinator
 from homeassistant.components.sensor import SensorEntity
+from homeassistant.core import callback
+from homeassistant.helpers import entity_registry as er
+from homeassistant.helpers.dispatcher import async_dispatcher_connect
+from homeassistant.helpers.entity import DeviceInfo, EntityCategory
+from homeassistant.helpers.event import async_track_time_interval
+from homeassistant.helpers.update_coordinator import CoordinatorEntity
 
 
 async def async_setup_entry(hass, entry, async_add_devices):
@@ -23,15 +33,97 @@ async def async_setup_entry(hass, entry, async_add_devices):
                 ]
             )
 
+    diagnostics = []
+
+    @callback
+    def async_update_diagnostic_sensors(options):
+        """Add or remove the diagnostic sensors to match the options."""
+        if options.get(CONF_DIAGNOSTIC_SENSORS) and not diagnostics:
+            diagnostics.extend(
+                ElectroluxDiagnosticSensor(coordinator, entry, key, name, unit)
+                for key, (name, unit) in diagnostic_sensors.items()
+            )
+            async_add_devices(diagnostics)
+        elif not options.get(CONF_DIAGNOSTIC_SENSORS):
+            for sensor in diagnostics:
+                sensor.async_remove_permanently()
+            diagnostics.clear()
+            # Sensors of a previous run that were not added this time
+            registry = er.async_get(hass)
+            for key in diagnostic_sensors:
+                entity_id = registry.async_get_entity_id("sensor", DOMAIN, f"{entry.entry_id}-diagnostics-{key}")
+                if entity_id is not None:
+                    registry.async_remove(entity_id)
+
+    async_update_diagnostic_sensors(entry.options)
+    entry.async_on_unload(
+        async_dispatcher_connect(hass, SIGNAL_OPTIONS_UPDATED.format(entry.entry_id), async_update_diagnostic_sensors)
+    )
+
 
 class ElectroluxStatusSensor(ElectroluxStatusEntity, SensorEntity):
     """Electrolux Status Sensor class."""
 
+    async def async_added_to_hass(self) -> None:
+        await super().async_added_to_hass()
+        if self.entity_attr in interpolated_time_sensors:
+            self.async_on_remove(async_track_time_interval(
+                self.hass, self._async_interpolate, timedelta(seconds=INTERPOLATION_INTERVAL)
+            ))
+
+    @callback
+    def _async_interpolate(self, now) -> None:
+        """Write the extrapolated time when it moved to another minute since the last write."""
+        if not self.available:
+            return
+        value = self.native_value
+        state = self.hass.states.get(self.entity_id)
+        if value is not None and (state is None or state.state != str(value)):
+            self.async_write_ha_state()
+
     @property
     def native_value(self):
         """Return the state of the sensor."""
-        return self.get_entity.state
+        entity = self.get_entity
+        if isinstance(entity, ApplianceTimeSensor):
+            return entity.estimate(self.get_appliance.appliance_state(self.entity_source))
+        return entity.state
 
     @property
     def native_unit_of_measurement(self):
         return cast(ApplianceSensor, self.get_entity).unit
+
+
+class ElectroluxDiagnosticSensor(CoordinatorEntity, SensorEntity):
+    """Refresh statistics of a config entry."""
+
+    _attr_entity_category = EntityCategory.DIAGNOSTIC
+
+    def __init__(self, coordinator: ElectroluxStatusDataUpdateCoordinator, config_entry, key, name, unit):
+        super().__init__(coordinator)
+        self.config_entry = config_entry
+        self.key = key
+        self._attr_name = f"Electrolux {config_entry.title} {name}"
+        self._attr_unique_id = f"{config_entry.entry_id}-diagnostics-{key}"
+        self._attr_native_unit_of_measurement = unit
+
+    @property
+    def device_info(self):
+        return DeviceInfo(
+            identifiers={(DOMAIN, self.config_entry.entry_id)},
+            name=f"Electrolux {self.config_entry.title}",
+            manufacturer="Electrolux",
+        )
+
+    @property
+    def native_value(self):
+        return self.coordinator.diagnostic_values().get(self.key)
+
+    @callback
+    def async_remove_permanently(self) -> None:
+        """Remove the sensor and its entity registry entry."""
+        if self.registry_entry is not None:
+            # Removing the registry entry removes the entity as well
+            er.async_get(self.hass).async_remove(self.entity_id)
+        elif self.hass is not None:
+            self.hass.async_create_task(self.async_remove())
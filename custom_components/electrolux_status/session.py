@@ -0,0 +1,106 @@
+"""Session handling for Electrolux Status."""
+import asyncio
+import logging
+import time
+
+from pyelectroluxconnect import Session
+
+from homeassistant.core import HomeAssistant
+
+from .const import DEFAULT_TOKEN_LIFETIME
+from .metrics import CoordinatorMetrics
+
+_LOGGER: logging.Logger = logging.getLogger(__package__)
+
+AUTH_ERROR_STATUSES = (401, 403)
+
+
+def _http_status(ex: BaseException):
+    """Return the HTTP status carried by an exception or its requests response, None if there is none."""
+    status = getattr(ex, "status_code", None) or getattr(ex, "status", None)
+    if status is None:
+        status = getattr(getattr(ex, "response", None), "status_code", None)
+    return status
+
+
+def is_auth_error(ex: Exception) -> bool:
+    """Return true if the cloud rejected the session token.
+
+    Only the HTTP status is trusted, also through the exceptions the library raised from;
+    messages contain ids and serials that can look like a status.
+    """
+    seen = set()
+    while ex is not None and id(ex) not in seen:
+        seen.add(id(ex))
+        if _http_status(ex) in AUTH_ERROR_STATUSES:
+            return True
+        ex = ex.__cause__ or ex.__context__
+    return False
+
+
+class ElectroluxSessionManager:
+    """Keep a pyelectroluxconnect session logged in across polls."""
+
+    def __init__(self, hass: HomeAssistant, client: Session, token_lifetime: int = DEFAULT_TOKEN_LIFETIME,
+                 metrics: CoordinatorMetrics = None) -> None:
+        """Initialize."""
+        self.hass = hass
+        self.api = client
+        self.token_lifetime = token_lifetime
+        self.metrics = metrics or CoordinatorMetrics()
+        self.logins = 0
+        self.reauthentications = 0
+        self._token_expires = 0.0
+        self._generation = 0
+        self._lock = asyncio.Lock()
+
+    @property
+    def token_valid(self) -> bool:
+        return time.monotonic() < self._token_expires
+
+    @property
+    def token_expires(self) -> float:
+        return self._token_expires
+
+    def adopt(self, token_expires: float):
+        """Use the client as already logged in, until ``token_expires`` (monotonic time)."""
+        self._token_expires = token_expires
+        self._generation += 1
+
+    def invalidate(self):
+        self._token_expires = 0.0
+
+    async def async_login(self, force=False):
+        """Log in, unless the current token is still valid."""
+        async with self._lock:
+            if self.token_valid and not force:
+                return
+            with self.metrics.timer("login"):
+                await self.hass.async_add_executor_job(self.api.login)
+            self._token_expires = time.monotonic() + self.token_lifetime
+            self._generation += 1
+            self.logins += 1
+            _LOGGER.debug("Logged in to ElectroluxStatus (logins: %s, re-authentications: %s)",
+                          self.logins, self.reauthentications)
+
+    async def _async_reauthenticate(self, generation):
+        async with self._lock:
+            # Another call already logged in again after the same failure
+            if generation != self._generation:
+                return
+            self.invalidate()
+        self.reauthentications += 1
+        await self.async_login()
+
+    async def async_call(self, func, *args):
+        """Run a blocking session call, logging in again once on an auth error."""
+        await self.async_login()
+        generation = self._generation
+        try:
+            return await self.hass.async_add_executor_job(func, *args)
+        except Exception as ex:
+            if not is_auth_error(ex):
+                raise
+            _LOGGER.debug("ElectroluxStatus session rejected, logging in again: %s", ex)
+        await self._async_reauthenticate(generation)
+        return await self.hass.async_add_executor_job(func, *args)
@@ -0,0 +1,70 @@
+"""Warm start snapshot for Electrolux Status."""
+import hashlib
+import logging
+
+from homeassistant.core import HomeAssistant
+from homeassistant.helpers.storage import Store
+
+from .const import DOMAIN
+
+_LOGGER: logging.Logger = logging.getLogger(__package__)
+
+STORAGE_VERSION = 1
+SAVE_DELAY = 60
+
+
+def snapshot_key(account) -> str:
+    """Return the storage key of the snapshot of an account, without its user name in clear."""
+    digest = hashlib.sha256("|".join(account).encode()).hexdigest()[:16]
+    return f"{DOMAIN}.snapshot.{digest}"
+
+
+class ApplianceSnapshot:
+    """Last appliance list and appliance payloads of an account, persisted in Home Assistant storage.
+
+    Like the account coordinator it is shared by the config entries of the account. On the
+    next start the entities are created from it right away, before the cloud answers.
+    """
+
+    def __init__(self, hass: HomeAssistant, account) -> None:
+        """Initialize."""
+        self._store = Store(hass, STORAGE_VERSION, snapshot_key(account))
+        self._appliances_json = None
+        self._appliances = {}
+
+    async def async_load(self):
+        """Return (appliance list, {pnc_id: payload}), or None if nothing was saved yet."""
+        try:
+            data = await self._store.async_load()
+        except Exception as ex:  # pylint: disable=broad-except
+            _LOGGER.warning("Could not load the ElectroluxStatus snapshot: %s", ex)
+            return None
+        if not data or not data.get("appliances"):
+            return None
+        return data["appliances"], data.get("payloads", {})
+
+    def async_schedule_save(self, appliances_json, appliances):
+        self._appliances_json = appliances_json
+        self._appliances = appliances
+        self._store.async_delay_save(self._data_to_save, SAVE_DELAY)
+
+    async def async_flush(self):
+        """Write a scheduled save right away, nothing is written later anymore."""
+        if self._appliances_json is not None:
+            await self._store.async_save(self._data_to_save())
+
+    async def async_remove(self):
+        await self._store.async_remove()
+
+    def _data_to_save(self):
+        return {
+            "appliances": self._appliances_json,
+            "payloads": {
+                pnc_id: {
+                    "status": appliance.data.status,
+                    "states": appliance.data.states,
+                    "profile": appliance.data.profile,
+                }
+                for pnc_id, appliance in self._appliances.items() if appliance.data is not None
+            },
+        }
@@ -0,0 +1,104 @@
+"""Push updates for Electrolux Status.
+
+The Electrolux cloud API used by pyelectroluxconnect only offers polling, so the stream
+endpoint is configured in the integration options (for example a local bridge). Every text
+message on the websocket is a JSON state delta for one appliance::
+
+    {
+        "pncId": "<appliance PNC id>",
+        "status": {"status": "Connected"},
+        "states": {"<state key>": {"numberValue": 42}}
+    }
+
+``status`` and ``states`` are both optional; state fields are merged into the cached state.
+Messages of any other shape are discarded.
+"""
+import asyncio
+import logging
+
+import aiohttp
+
+from homeassistant.core import HomeAssistant
+from homeassistant.helpers.aiohttp_client import async_get_clientsession
+
+from .const import STREAM_HEARTBEAT, STREAM_RECONNECT_MIN, STREAM_RECONNECT_MAX
+
+_LOGGER: logging.Logger = logging.getLogger(__package__)
+
+
+def is_valid_delta(delta) -> bool:
+    """Return true if a decoded message has the shape of a state delta."""
+    if not isinstance(delta, dict) or not isinstance(delta.get("pncId"), str):
+        return False
+    if not isinstance(delta.get("status", {}), dict):
+        return False
+    states = delta.get("states", {})
+    return isinstance(states, dict) and all(isinstance(fields, dict) for fields in states.values())
+
+
+class ElectroluxStreamTransport:
+    """Keep a websocket open and hand the received deltas to the coordinator."""
+
+    def __init__(self, hass: HomeAssistant, coordinator, url: str) -> None:
+        """Initialize."""
+        self.hass = hass
+        self.coordinator = coordinator
+        self.url = url
+        self.connected = False
+        self.messages = 0
+        self._task = None
+
+    def async_start(self):
+        if self._task is None:
+            self._task = self.hass.loop.create_task(self._async_run())
+
+    async def async_stop(self):
+        if self._task is None:
+            return
+        self._task.cancel()
+        try:
+            await self._task
+        except asyncio.CancelledError:
+            pass
+        self._task = None
+
+    async def _async_run(self):
+        session = async_get_clientsession(self.hass)
+        delay = STREAM_RECONNECT_MIN
+        while True:
+            try:
+                async with session.ws_connect(self.url, heartbeat=STREAM_HEARTBEAT) as ws:
+                    _LOGGER.debug("Connected to ElectroluxStatus stream %s", self.url)
+                    self._set_connected(True)
+                    delay = STREAM_RECONNECT_MIN
+                    async for msg in ws:
+                        if msg.type == aiohttp.WSMsgType.TEXT:
+                            self._handle_message(msg)
+                        elif msg.type in (aiohttp.WSMsgType.CLOSED, aiohttp.WSMsgType.ERROR):
+                            break
+            except asyncio.CancelledError:
+                self.connected = False
+                raise
+            except Exception as ex:  # pylint: disable=broad-except
+                _LOGGER.warning("ElectroluxStatus stream error: %s", ex)
+            self._set_connected(False)
+            await asyncio.sleep(delay)
+            delay = min(delay * 2, STREAM_RECONNECT_MAX)
+
+    def _handle_message(self, msg):
+        try:
+            delta = msg.json()
+        except ValueError:
+            _LOGGER.debug("Ignoring malformed stream message: %s", msg.data)
+            return
+        if not is_valid_delta(delta):
+            _LOGGER.debug("Ignoring stream message that is not a state delta: %s", msg.data)
+            return
+        self.messages += 1
+        self.coordinator.async_apply_delta(delta)
+
+    def _set_connected(self, connected):
+        if connected == self.connected:
+            return
+        self.connected = connected
+        self.coordinator.async_stream_connected(connected)
@@ -0,0 +1 @@
+"""Tests for the Electrolux Status integration."""
@@ -0,0 +1,105 @@
+"""Tests of the push stream of Electrolux Status, against a local websocket server.
+
+Run from the repository root (requires Home Assistant to be installed)::
+
+    python -m pytest tests
+"""
+import asyncio
+import json
+from types import SimpleNamespace
+
+import pytest
+
+pytest.importorskip("homeassistant")
+
+import aiohttp
+from aiohttp import web
+from aiohttp.test_utils import TestServer
+
+from custom_components.electrolux_status import stream
+from custom_components.electrolux_status.stream import ElectroluxStreamTransport, is_valid_delta
+
+DELTAS = [
+    {"pncId": "914550000_00:12345678-443E07000000", "states": {"0x0001": {"numberValue": 3}}},
+    {"pncId": "914550000_00:12345678-443E07000000", "status": {"status": "Connected"}},
+]
+INVALID_MESSAGES = [
+    "not json",
+    json.dumps(["a", "list"]),
+    json.dumps({"states": {}}),
+    json.dumps({"pncId": "914550000_00:12345678-443E07000000", "states": {"0x0001": 3}}),
+    json.dumps({"pncId": "914550000_00:12345678-443E07000000", "status": "Connected"}),
+]
+
+
+class FakeCoordinator:
+    """Records what the stream hands to the account coordinator."""
+
+    def __init__(self) -> None:
+        self.polling_paused = False
+        self.deltas = []
+        self.paused_during_deltas = []
+        self.connections = []
+        self.disconnected = asyncio.Event()
+
+    def async_apply_delta(self, delta):
+        self.deltas.append(delta)
+        self.paused_during_deltas.append(self.polling_paused)
+
+    def async_stream_connected(self, connected):
+        self.connections.append(connected)
+        self.polling_paused = connected
+        if not connected:
+            self.disconnected.set()
+
+
+async def _push_and_close(request):
+    ws = web.WebSocketResponse()
+    await ws.prepare(request)
+    for message in INVALID_MESSAGES[:2]:
+        await ws.send_str(message)
+    await ws.send_json(DELTAS[0])
+    for message in INVALID_MESSAGES[2:]:
+        await ws.send_str(message)
+    await ws.send_json(DELTAS[1])
+    await ws.close()
+    return ws
+
+
+async def _run_stream(monkeypatch):
+    app = web.Application()
+    app.router.add_get("/stream", _push_and_close)
+    coordinator = FakeCoordinator()
+    async with TestServer(app) as server, aiohttp.ClientSession() as session:
+        monkeypatch.setattr(stream, "async_get_clientsession", lambda hass: session)
+        transport = ElectroluxStreamTransport(
+            SimpleNamespace(loop=asyncio.get_running_loop()), coordinator, str(server.make_url("/stream"))
+        )
+        transport.async_start()
+        try:
+            await asyncio.wait_for(coordinator.disconnected.wait(), 10)
+        finally:
+            await transport.async_stop()
+    return transport, coordinator
+
+
+def test_stream_applies_deltas_and_pauses_polling(monkeypatch):
+    transport, coordinator = asyncio.run(_run_stream(monkeypatch))
+
+    assert coordinator.deltas == DELTAS
+    assert transport.messages == len(DELTAS)
+    # Polling pauses while connected and resumes once the server closed the stream
+    assert coordinator.paused_during_deltas == [True, True]
+    assert coordinator.connections == [True, False]
+    assert not coordinator.polling_paused
+    assert not transport.connected
+
+
+@pytest.mark.parametrize("message", INVALID_MESSAGES[1:])
+def test_invalid_deltas_are_rejected(message):
+    assert not is_valid_delta(json.loads(message))
+
+
+@pytest.mark.parametrize("delta", DELTAS)
+def test_valid_deltas_are_accepted(delta):
+    assert is_valid_delta(delta)